@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException, UploadFile, File, Path, Query, Dep
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime, timezone
+import logging
 import uuid
 
 from app.core.config import settings
@@ -16,6 +17,7 @@ from app.services.storage.factory import storage_service
 import os
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 class AudioChapterBase(BaseModel):
@@ -360,7 +362,7 @@ async def get_streaming_url(
         file_key = file_path.lstrip('/').lstrip('./')
     
     local_url = f"http://localhost:{settings.PORT}{settings.API_V1_STR}/files/{file_key}"
-    print(f"Generated streaming URL: {local_url}")
+    logger.debug("Generated streaming URL: %s", local_url)
     
     duration = chapter.audio_metadata.duration if getattr(chapter, "audio_metadata", None) else 0
     return StreamingUrlResponse(streaming_url=local_url, expires_at=expires, duration=duration)
@@ -400,8 +402,8 @@ async def delete_audio_chapter(
                     pass
             if local_path:
                 try:
-                    if os.path.exists(local_path):
-                        os.remove(local_path)
+                    # 존재 확인 없이 바로 삭제 (이미 없는 파일이면 무시)
+                    os.remove(local_path)
                 except Exception:
                     pass
         # 메타데이터/원본 등 추가 키가 있다면 여기서 추가 삭제 가능
@@ -491,15 +491,15 @@ async def download_file(
                 raise HTTPException(status_code=500, detail="Failed to generate download URL")
         
         # 로컬 환경에서는 직접 스트리밍 (Range 지원)
-        file_data = await storage_service.download_file(file_key)
-        if file_data is None:
+        # 파일 정보 조회 (file_exists의 HEAD 결과를 공유)
+        file_info = await storage_service.get_file_info(file_key)
+        if file_info is None:
             raise HTTPException(status_code=404, detail="File not found")
 
-        file_size = len(file_data)
-        # 파일 정보 조회
-        file_info = await storage_service.get_file_info(file_key)
-        content_type = file_info.content_type if file_info else "application/octet-stream"
+        file_size = file_info.size
+        content_type = file_info.content_type or "application/octet-stream"
 
+        byte_range = None
         range_header = request.headers.get("range") if request else None
         if range_header and range_header.lower().startswith("bytes="):
             # Parse Range: bytes=start-end
@@ -521,20 +521,35 @@ async def download_file(
                             "Accept-Ranges": "bytes",
                         },
                     )
-                chunk = file_data[start : end + 1]
-                headers = {
-                    "Content-Range": f"bytes {start}-{end}/{file_size}",
-                    "Content-Length": str(len(chunk)),
-                    "Accept-Ranges": "bytes",
-                }
-                return StreamingResponse(io.BytesIO(chunk), status_code=206, media_type=content_type, headers=headers)
-            except Exception:
+                byte_range = (start, end)
+            except ValueError:
                 # Fallback to full content on parse error
                 pass
 
+        if hasattr(storage_service, "iter_range"):
+            # S3: 요청 범위만 get_object(Range=...)로 청크 스트리밍 (대용량 파일도 메모리에 올리지 않음)
+            start, end = byte_range or (None, None)
+            body = storage_service.iter_range(file_key, start, end)
+        else:
+            file_data = await storage_service.download_file(file_key)
+            if file_data is None:
+                raise HTTPException(status_code=404, detail="File not found")
+            if byte_range:
+                file_data = file_data[byte_range[0] : byte_range[1] + 1]
+            body = io.BytesIO(file_data)
+
+        if byte_range:
+            start, end = byte_range
+            headers = {
+                "Content-Range": f"bytes {start}-{end}/{file_size}",
+                "Content-Length": str(end - start + 1),
+                "Accept-Ranges": "bytes",
+            }
+            return StreamingResponse(body, status_code=206, media_type=content_type, headers=headers)
+
         # Full content
         return StreamingResponse(
-            io.BytesIO(file_data),
+            body,
             media_type=content_type,
             headers={
                 "Content-Length": str(file_size),
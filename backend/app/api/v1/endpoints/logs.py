@@ -4,15 +4,21 @@ VOJ Audiobooks API - 로그 관리 엔드포인트
 """
 from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from datetime import datetime, timezone
+import asyncio
 import json
+import logging
 import os
 
 from app.core.config import settings
 from app.core.auth.simple import get_current_user_claims, require_any_scope
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# 생성을 확인한 디렉토리 캐시 (요청마다 makedirs 호출 방지)
+_ensured_dirs: Set[str] = set()
 
 
 class LogBackupRequest(BaseModel):
@@ -54,9 +60,8 @@ async def backup_logs(
     try:
         user_id = str(claims.get("sub") or claims.get("username") or "")
         
-        # 백업 디렉토리 생성
+        # 백업 디렉토리 경로
         backup_dir = os.path.join("./storage", "logs", "backups")
-        os.makedirs(backup_dir, exist_ok=True)
         
         # 백업 파일명 생성
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -80,10 +85,9 @@ async def backup_logs(
             "logs": backup_request.logs
         }
         
-        # 파일 저장
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            json.dump(backup_data, f, ensure_ascii=False, indent=2)
-        
+        # 파일 저장 (이벤트 루프를 막지 않도록 스레드에서 실행)
+        await asyncio.to_thread(_write_backup_file, backup_path, backup_data)
+
         return LogBackupResponse(
             success=True,
             backup_id=backup_request.session_id,
@@ -115,35 +119,8 @@ async def list_log_backups(
                 "total": 0
             }
         
-        backups = []
-        
         # 백업 파일들 조회
-        for filename in sorted(os.listdir(backup_dir), reverse=True)[:limit]:
-            if filename.endswith('.json'):
-                file_path = os.path.join(backup_dir, filename)
-                
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        backup_data = json.load(f)
-                    
-                    backup_info = backup_data.get("backup_info", {})
-                    file_stats = os.stat(file_path)
-                    
-                    backups.append({
-                        "filename": filename,
-                        "backup_id": backup_info.get("backup_id"),
-                        "session_name": backup_info.get("session_name"),
-                        "created_at": backup_info.get("created_at"),
-                        "total_logs": backup_info.get("total_logs", 0),
-                        "file_size": file_stats.st_size,
-                        "chapter_id": backup_info.get("chapter_id"),
-                        "book_id": backup_info.get("book_id"),
-                        "tags": backup_info.get("tags", [])
-                    })
-                    
-                except Exception as e:
-                    print(f"Failed to read backup file {filename}: {e}")
-                    continue
+        backups = await asyncio.to_thread(_read_backup_entries, backup_dir, limit)
         
         return {
             "backups": backups,
@@ -169,14 +146,14 @@ async def delete_log_backup(
         backup_dir = os.path.join("./storage", "logs", "backups")
         backup_path = os.path.join(backup_dir, backup_filename)
         
-        if not os.path.exists(backup_path):
-            raise HTTPException(status_code=404, detail="Backup file not found")
-        
         # 보안 확인 (경로 순회 공격 방지)
         if not backup_path.startswith(backup_dir):
             raise HTTPException(status_code=400, detail="Invalid backup filename")
         
-        os.remove(backup_path)
+        try:
+            os.remove(backup_path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Backup file not found")
         
         return {
             "success": True,
@@ -211,18 +188,7 @@ async def cleanup_old_logs(
             }
         
         cutoff_time = datetime.now().timestamp() - (max_age_days * 24 * 3600)
-        deleted_count = 0
-        
-        for filename in os.listdir(backup_dir):
-            if filename.endswith('.json'):
-                file_path = os.path.join(backup_dir, filename)
-                
-                try:
-                    if os.path.getmtime(file_path) < cutoff_time:
-                        os.remove(file_path)
-                        deleted_count += 1
-                except Exception as e:
-                    print(f"Failed to delete old backup {filename}: {e}")
+        deleted_count = await asyncio.to_thread(_remove_old_backups, backup_dir, cutoff_time)
         
         return {
             "success": True,
@@ -251,32 +217,7 @@ async def get_log_stats(claims = Depends(require_any_scope(["admin"]))):
         
         # 백업 파일 통계
         backup_dir = os.path.join("./storage", "logs", "backups")
-        backup_stats = {
-            "total_backups": 0,
-            "total_backup_size": 0,
-            "oldest_backup": None,
-            "newest_backup": None
-        }
-        
-        if os.path.exists(backup_dir):
-            backup_files = [f for f in os.listdir(backup_dir) if f.endswith('.json')]
-            backup_stats["total_backups"] = len(backup_files)
-            
-            if backup_files:
-                file_times = []
-                total_size = 0
-                
-                for filename in backup_files:
-                    file_path = os.path.join(backup_dir, filename)
-                    stat = os.stat(file_path)
-                    file_times.append(stat.st_mtime)
-                    total_size += stat.st_size
-                
-                backup_stats.update({
-                    "total_backup_size": total_size,
-                    "oldest_backup": datetime.fromtimestamp(min(file_times)).isoformat(),
-                    "newest_backup": datetime.fromtimestamp(max(file_times)).isoformat()
-                })
+        backup_stats = await asyncio.to_thread(_collect_backup_stats, backup_dir)
         
         return {
             "websocket_stats": streamer_stats,
@@ -289,3 +230,122 @@ async def get_log_stats(claims = Depends(require_any_scope(["admin"]))):
             status_code=500,
             detail=f"Failed to get log stats: {str(e)}"
         )
+
+
+def _write_backup_file(backup_path: str, backup_data: Dict[str, Any]) -> None:
+    """백업 JSON 저장 (임시 파일에 쓴 뒤 원자적으로 교체하여 부분 파일 방지)"""
+    backup_dir = os.path.dirname(backup_path)
+    if backup_dir not in _ensured_dirs:
+        os.makedirs(backup_dir, exist_ok=True)
+        _ensured_dirs.add(backup_dir)
+    
+    try:
+        _replace_json_file(backup_path, backup_data)
+    except FileNotFoundError:
+        # 실행 중 디렉토리가 외부에서 삭제된 경우(정리 작업 등) 다시 만들고 한 번만 재시도
+        _ensured_dirs.discard(backup_dir)
+        os.makedirs(backup_dir, exist_ok=True)
+        _ensured_dirs.add(backup_dir)
+        _replace_json_file(backup_path, backup_data)
+
+
+def _replace_json_file(path: str, data: Dict[str, Any]) -> None:
+    """임시 파일에 JSON을 쓴 뒤 대상 경로로 교체"""
+    tmp_path = path + ".part"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _read_backup_entries(backup_dir: str, limit: int) -> List[Dict[str, Any]]:
+    """백업 디렉토리에서 최신 백업 파일 정보 조회 (동기 I/O)"""
+    backups = []
+    
+    with os.scandir(backup_dir) as it:
+        entries = sorted(it, key=lambda e: e.name, reverse=True)[:limit]
+    
+    for entry in entries:
+        if entry.name.endswith('.json'):
+            filename = entry.name
+            
+            try:
+                with open(entry.path, 'r', encoding='utf-8') as f:
+                    backup_data = json.load(f)
+                
+                backup_info = backup_data.get("backup_info", {})
+                file_stats = entry.stat()
+                
+                backups.append({
+                    "filename": filename,
+                    "backup_id": backup_info.get("backup_id"),
+                    "session_name": backup_info.get("session_name"),
+                    "created_at": backup_info.get("created_at"),
+                    "total_logs": backup_info.get("total_logs", 0),
+                    "file_size": file_stats.st_size,
+                    "chapter_id": backup_info.get("chapter_id"),
+                    "book_id": backup_info.get("book_id"),
+                    "tags": backup_info.get("tags", [])
+                })
+                
+            except Exception as e:
+                logger.warning("Failed to read backup file %s: %s", filename, e)
+                continue
+    
+    return backups
+
+
+def _remove_old_backups(backup_dir: str, cutoff_time: float) -> int:
+    """cutoff_time 이전에 수정된 백업 파일 삭제 (동기 I/O)"""
+    deleted_count = 0
+    
+    with os.scandir(backup_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.json'):
+                continue
+            
+            try:
+                if entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                    os.unlink(entry.path)
+                    deleted_count += 1
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning("Failed to delete old backup %s: %s", entry.name, e)
+    
+    return deleted_count
+
+
+def _collect_backup_stats(backup_dir: str) -> Dict[str, Any]:
+    """백업 파일 개수/크기/기간 통계 (동기 I/O)"""
+    backup_stats = {
+        "total_backups": 0,
+        "total_backup_size": 0,
+        "oldest_backup": None,
+        "newest_backup": None
+    }
+    
+    if os.path.exists(backup_dir):
+        file_times = []
+        total_size = 0
+        
+        with os.scandir(backup_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False):
+                    stat = entry.stat()
+                    file_times.append(stat.st_mtime)
+                    total_size += stat.st_size
+        
+        backup_stats["total_backups"] = len(file_times)
+        
+        if file_times:
+            backup_stats.update({
+                "total_backup_size": total_size,
+                "oldest_backup": datetime.fromtimestamp(min(file_times)).isoformat(),
+                "newest_backup": datetime.fromtimestamp(max(file_times)).isoformat()
+            })
+    
+    return backup_stats
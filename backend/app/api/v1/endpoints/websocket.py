@@ -8,7 +8,7 @@ from datetime import datetime
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 from typing import Optional
 
-from app.services.websocket.log_streamer import log_streamer, LogLevel, LogCategory
+from app.services.websocket.log_streamer import get_log_streamer, LogLevel, LogCategory
 
 router = APIRouter()
 
@@ -24,12 +24,12 @@ async def websocket_logs(
     - 전체 로그 또는 특정 챕터 로그 구독 가능
     - 양방향 통신으로 구독 관리
     """
-    conn_id = await log_streamer.connect(websocket, connection_id)
+    conn_id = await get_log_streamer().connect(websocket, connection_id)
     
     try:
         # 초기 챕터 구독 (쿼리 파라미터로 지정된 경우)
         if chapter_id:
-            await log_streamer.subscribe_to_chapter(conn_id, chapter_id)
+            await get_log_streamer().subscribe_to_chapter(conn_id, chapter_id)
         
         # 클라이언트 메시지 처리 루프
         while True:
@@ -56,7 +56,7 @@ async def websocket_logs(
     except WebSocketDisconnect:
         pass
     finally:
-        await log_streamer.disconnect(conn_id)
+        await get_log_streamer().disconnect(conn_id)
 
 
 async def handle_client_message(connection_id: str, message: dict) -> None:
@@ -67,29 +67,29 @@ async def handle_client_message(connection_id: str, message: dict) -> None:
         # 챕터 구독
         chapter_id = message.get("chapter_id")
         if chapter_id:
-            await log_streamer.subscribe_to_chapter(connection_id, chapter_id)
+            await get_log_streamer().subscribe_to_chapter(connection_id, chapter_id)
     
     elif message_type == "unsubscribe":
         # 챕터 구독 해제
         chapter_id = message.get("chapter_id")
         if chapter_id:
-            await log_streamer.unsubscribe_from_chapter(connection_id, chapter_id)
+            await get_log_streamer().unsubscribe_from_chapter(connection_id, chapter_id)
     
     elif message_type == "get_history":
         # 로그 히스토리 요청
         limit = message.get("limit", 50)
-        await log_streamer.send_log_history(connection_id, limit)
+        await get_log_streamer().send_log_history(connection_id, limit)
     
     elif message_type == "ping":
         # 연결 확인
-        await log_streamer.send_to_connection(connection_id, {
+        await get_log_streamer().send_to_connection(connection_id, {
             "type": "pong",
             "timestamp": datetime.now().isoformat()
         })
     
     else:
         # 알 수 없는 메시지 타입
-        await log_streamer.send_to_connection(connection_id, {
+        await get_log_streamer().send_to_connection(connection_id, {
             "type": "error",
             "message": f"Unknown message type: {message_type}"
         })
@@ -105,11 +105,11 @@ async def websocket_chapter_status(
     특정 챕터의 실시간 상태 업데이트 WebSocket
     - 인코딩 진행률, 상태 변경 등 실시간 알림
     """
-    conn_id = await log_streamer.connect(websocket, connection_id)
+    conn_id = await get_log_streamer().connect(websocket, connection_id)
     
     try:
         # 해당 챕터 자동 구독
-        await log_streamer.subscribe_to_chapter(conn_id, chapter_id)
+        await get_log_streamer().subscribe_to_chapter(conn_id, chapter_id)
         
         # 현재 챕터 상태 전송
         await send_current_chapter_status(conn_id, chapter_id)
@@ -136,7 +136,7 @@ async def websocket_chapter_status(
     except WebSocketDisconnect:
         pass
     finally:
-        await log_streamer.disconnect(conn_id)
+        await get_log_streamer().disconnect(conn_id)
 
 
 async def send_current_chapter_status(connection_id: str, chapter_id: str) -> None:
@@ -146,7 +146,7 @@ async def send_current_chapter_status(connection_id: str, chapter_id: str) -> No
         # 챕터 정보 조회
         chapter = AudioChapter.get_by_id(chapter_id)
         if not chapter:
-            await log_streamer.send_to_connection(connection_id, {
+            await get_log_streamer().send_to_connection(connection_id, {
                 "type": "error",
                 "message": f"Chapter {chapter_id} not found"
             })
@@ -173,10 +173,10 @@ async def send_current_chapter_status(connection_id: str, chapter_id: str) -> No
             "timestamp": datetime.now().isoformat()
         }
         
-        await log_streamer.send_to_connection(connection_id, status_data)
+        await get_log_streamer().send_to_connection(connection_id, status_data)
         
     except Exception as e:
-        await log_streamer.send_to_connection(connection_id, {
+        await get_log_streamer().send_to_connection(connection_id, {
             "type": "error",
             "message": f"Failed to get chapter status: {str(e)}"
         })
@@ -185,7 +185,7 @@ async def send_current_chapter_status(connection_id: str, chapter_id: str) -> No
 # 편의 함수들
 def log_upload_start(chapter_id: str, filename: str, file_size: int) -> None:
     """업로드 시작 로그"""
-    log_streamer.add_log(
+    get_log_streamer().add_log(
         level=LogLevel.INFO,
         category=LogCategory.UPLOAD,
         message=f"Upload started: {filename}",
@@ -196,7 +196,7 @@ def log_upload_start(chapter_id: str, filename: str, file_size: int) -> None:
 
 def log_upload_complete(chapter_id: str, filename: str) -> None:
     """업로드 완료 로그"""
-    log_streamer.add_log(
+    get_log_streamer().add_log(
         level=LogLevel.INFO,
         category=LogCategory.UPLOAD,
         message=f"Upload completed: {filename}",
@@ -206,7 +206,7 @@ def log_upload_complete(chapter_id: str, filename: str) -> None:
 
 def log_encoding_error(chapter_id: str, job_id: str, error_message: str) -> None:
     """인코딩 에러 로그"""
-    log_streamer.add_log(
+    get_log_streamer().add_log(
         level=LogLevel.ERROR,
         category=LogCategory.ERROR,
         message=f"Encoding failed: {error_message}",
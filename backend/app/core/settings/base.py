@@ -71,6 +71,8 @@ class BaseAppSettings(BaseSettings):
     
     # S3 기본 설정
     S3_BUCKET_NAME: str = "voj-audiobooks"
+    S3_MAX_CONCURRENCY: int = 16  # S3 호출 전용 스레드 풀 크기
+    S3_MULTIPART_THRESHOLD: int = 32 * 1024 * 1024  # 이 크기 이상은 멀티파트 업로드
     
     # 간단한 인증 설정
     SIMPLE_AUTH_ENABLED: bool = True
@@ -7,7 +7,7 @@ from pynamodb.attributes import (
     UTCDateTimeAttribute, MapAttribute
 )
 from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 
 from app.core.config import settings
@@ -141,13 +141,13 @@ class AudioChapter(BaseModel):
     def mark_processing_started(self):
         """처리 시작 표시"""
         self.status = "processing"
-        self.processing_started_at = datetime.utcnow()
+        self.processing_started_at = datetime.now(timezone.utc)
         self.save()
     
     def mark_processing_completed(self, audio_metadata: Dict[str, Any]):
         """처리 완료 표시"""
         self.status = "ready"
-        self.processing_completed_at = datetime.utcnow()
+        self.processing_completed_at = datetime.now(timezone.utc)
         self.audio_metadata = AudioMetadata(**audio_metadata)
         self.save()
     
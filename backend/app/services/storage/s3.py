@@ -3,15 +3,34 @@ VOJ Audiobooks API - S3 스토리지 서비스
 AWS S3를 사용한 스토리지 구현
 """
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
-from typing import Optional, BinaryIO, Dict, List
-from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Optional, BinaryIO, Dict, Iterable, List, Tuple
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
+import atexit
 import functools
+import os
+import time
 
 from app.core.config import settings
 from .base import BaseStorageService, FileInfo, UploadResult
 
+# HEAD 결과 공유 캐시 유지 시간(초)과 만료 항목 정리 기준
+_HEAD_CACHE_TTL = 1.0
+_HEAD_CACHE_SWEEP_SIZE = 1024
+
+# delete_objects 요청당 최대 키 개수 (S3 제한)
+_DELETE_BATCH_SIZE = 1000
+
+# iter_range 응답 본문 읽기 단위 (바이트)
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# 멀티파트 업로드/다운로드 한 건이 사용하는 전송 스레드 수
+_TRANSFER_MAX_CONCURRENCY = 8
+
 
 class S3StorageService(BaseStorageService):
     """AWS S3 스토리지 서비스"""
@@ -21,17 +40,55 @@ class S3StorageService(BaseStorageService):
         self.region = settings.AWS_REGION
         
         # S3 클라이언트 생성
+        # 연결 풀은 전용 스레드 풀 + 전송 스레드 수만큼 (botocore 기본 10개로는 동시 호출 시 연결이 버려짐)
+        self._max_concurrency = getattr(settings, 'S3_MAX_CONCURRENCY', 16)
         self.s3_client = boto3.client(
             's3',
             region_name=self.region,
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            config=Config(max_pool_connections=self._max_concurrency + _TRANSFER_MAX_CONCURRENCY)
         )
+        
+        # S3 호출 전용 스레드 풀 (기본 executor를 다른 블로킹 작업과 공유하지 않음, 첫 호출 시 생성)
+        # Mangum은 Lambda 호출마다 lifespan 종료를 실행하므로 풀은 프로세스 종료 시에만 정리
+        self._executor: Optional[ThreadPoolExecutor] = None
+        atexit.register(self._shutdown_executor)
+        
+        # CloudFront 서명기 캐시 (키는 프로세스 수명 동안 1회만 로드)
+        self._cf_signer = None
+        self._cf_signer_lock = asyncio.Lock()
+        
+        # 동시 HEAD 요청 병합용 단기 캐시 (key -> (만료 시각, 조회 Task))
+        self._head_cache: Dict[str, Tuple[float, asyncio.Future]] = {}
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """S3 전용 스레드 풀 반환 (aclose 이후에는 새로 생성)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency,
+                thread_name_prefix="s3"
+            )
+        return self._executor
     
     def _run_async(self, func, *args, **kwargs):
         """동기 함수를 비동기로 실행"""
-        loop = asyncio.get_event_loop()
-        return loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs))
+    
+    def _shutdown_executor(self) -> None:
+        """S3 전용 스레드 풀 종료 (이후 호출에서는 새로 생성)"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+    
+    async def aclose(self) -> None:
+        """S3 전용 스레드 풀 종료
+        
+        앱 lifespan 종료에서는 호출하지 않음 (Lambda 웜 컨테이너에서 풀 재사용).
+        종료 후에도 다음 호출에서 스레드 풀을 다시 만든다.
+        """
+        self._shutdown_executor()
     
     async def upload_file(
         self, 
@@ -42,6 +99,14 @@ class S3StorageService(BaseStorageService):
     ) -> UploadResult:
         """파일 업로드"""
         try:
+            # 업로드 크기 계산 (업로드 후 HEAD 재조회 방지)
+            file_size = None
+            if file_data.seekable():
+                start = file_data.tell()
+                file_data.seek(0, os.SEEK_END)
+                file_size = file_data.tell() - start
+                file_data.seek(start)
+            
             # 업로드 매개변수 준비
             upload_args = {
                 'Bucket': self.bucket_name,
@@ -53,12 +118,32 @@ class S3StorageService(BaseStorageService):
             if metadata:
                 upload_args['Metadata'] = metadata
             
-            # S3에 업로드
-            await self._run_async(self.s3_client.put_object, **upload_args)
+            # S3에 업로드 (대용량은 TransferManager 멀티파트로 병렬 전송)
+            multipart_threshold = getattr(settings, 'S3_MULTIPART_THRESHOLD', 32 * 1024 * 1024)
+            if file_size is not None and file_size >= multipart_threshold:
+                extra_args = {k: v for k, v in upload_args.items() if k not in ('Bucket', 'Key', 'Body')}
+                await self._run_async(
+                    self.s3_client.upload_fileobj,
+                    file_data,
+                    self.bucket_name,
+                    key,
+                    ExtraArgs=extra_args,
+                    Config=TransferConfig(
+                        multipart_threshold=multipart_threshold,
+                        multipart_chunksize=16 * 1024 * 1024,
+                        max_concurrency=_TRANSFER_MAX_CONCURRENCY,
+                        use_threads=True
+                    )
+                )
+            else:
+                await self._run_async(self.s3_client.put_object, **upload_args)
+            
+            self._head_cache.pop(key, None)
             
-            # 파일 크기 확인
-            file_info = await self.get_file_info(key)
-            file_size = file_info.size if file_info else 0
+            # 스트림 크기를 알 수 없는 경우에만 파일 크기 조회
+            if file_size is None:
+                file_info = await self.get_file_info(key)
+                file_size = file_info.size if file_info else 0
             
             return UploadResult(
                 success=True,
@@ -76,14 +161,19 @@ class S3StorageService(BaseStorageService):
             )
     
     async def download_file(self, key: str) -> Optional[bytes]:
-        """파일 다운로드"""
+        """파일 다운로드 (전체를 메모리로 읽음 - 대용량/부분 요청은 iter_range 사용)"""
         try:
             response = await self._run_async(
                 self.s3_client.get_object,
                 Bucket=self.bucket_name,
                 Key=key
             )
-            return response['Body'].read()
+            body = response['Body']
+            try:
+                # 본문 읽기도 블로킹 I/O이므로 S3 스레드 풀에서 수행
+                return await self._run_async(body.read)
+            finally:
+                body.close()
             
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchKey':
@@ -92,38 +182,119 @@ class S3StorageService(BaseStorageService):
         except Exception:
             return None
     
-    async def delete_file(self, key: str) -> bool:
-        """파일 삭제"""
+    async def iter_range(
+        self,
+        key: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        객체(또는 start~end 바이트 범위)를 청크 단위로 읽어 반환
+        get_object(Range=...)로 필요한 범위만 요청하므로 파일 전체를 메모리에 올리지 않음
+        """
+        params = {'Bucket': self.bucket_name, 'Key': key}
+        if start is not None or end is not None:
+            params['Range'] = f"bytes={start or 0}-{'' if end is None else end}"
+        
+        response = await self._run_async(self.s3_client.get_object, **params)
+        body = response['Body']
+        try:
+            while True:
+                chunk = await self._run_async(body.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            body.close()
+    
+    async def stream_to(self, key: str, dest_path: str) -> bool:
+        """파일을 메모리에 올리지 않고 로컬 경로로 바로 다운로드"""
         try:
+            # download_file은 청크 단위(대용량은 범위 병렬)로 임시 파일에 쓴 뒤 교체함
             await self._run_async(
-                self.s3_client.delete_object,
-                Bucket=self.bucket_name,
-                Key=key
+                self.s3_client.download_file,
+                self.bucket_name,
+                key,
+                dest_path,
+                Config=TransferConfig(max_concurrency=_TRANSFER_MAX_CONCURRENCY)
             )
             return True
-            
+        
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+                return False
+            raise
         except Exception:
             return False
     
-    async def file_exists(self, key: str) -> bool:
-        """파일 존재 여부 확인"""
+    async def delete_file(self, key: str) -> bool:
+        """파일 삭제"""
         try:
             await self._run_async(
-                self.s3_client.head_object,
+                self.s3_client.delete_object,
                 Bucket=self.bucket_name,
                 Key=key
             )
+            self._head_cache.pop(key, None)
             return True
             
-        except ClientError as e:
-            if e.response['Error']['Code'] == '404':
-                return False
-            raise
         except Exception:
             return False
     
+    async def delete_files(self, keys: Iterable[str]) -> Dict[str, bool]:
+        """여러 파일 일괄 삭제 (delete_objects로 최대 1000개씩 묶어 요청)"""
+        keys = list(dict.fromkeys(keys))
+        results = {key: True for key in keys}
+        
+        for i in range(0, len(keys), _DELETE_BATCH_SIZE):
+            batch = keys[i:i + _DELETE_BATCH_SIZE]
+            try:
+                response = await self._run_async(
+                    self.s3_client.delete_objects,
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+                for error in response.get('Errors', []):
+                    results[error['Key']] = False
+            except Exception:
+                for key in batch:
+                    results[key] = False
+            
+            for key in batch:
+                self._head_cache.pop(key, None)
+        
+        return results
+    
+    async def file_exists(self, key: str) -> bool:
+        """파일 존재 여부 확인"""
+        return await self.get_file_info(key) is not None
+    
     async def get_file_info(self, key: str) -> Optional[FileInfo]:
-        """파일 정보 조회"""
+        """파일 정보 조회 (짧은 시간 내 같은 키 조회는 하나의 HEAD 요청을 공유)"""
+        now = time.monotonic()
+        cached = self._head_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return await asyncio.shield(cached[1])
+        
+        if len(self._head_cache) >= _HEAD_CACHE_SWEEP_SIZE:
+            self._head_cache = {k: v for k, v in self._head_cache.items() if v[0] > now}
+        
+        task = asyncio.ensure_future(self._fetch_file_info(key))
+        self._head_cache[key] = (now + _HEAD_CACHE_TTL, task)
+        
+        def _evict_failed(t: asyncio.Future) -> None:
+            # 실패한 조회는 캐시하지 않음
+            if t.cancelled() or t.exception() is not None:
+                entry = self._head_cache.get(key)
+                if entry is not None and entry[1] is t:
+                    del self._head_cache[key]
+        
+        task.add_done_callback(_evict_failed)
+        return await asyncio.shield(task)
+    
+    async def _fetch_file_info(self, key: str) -> Optional[FileInfo]:
+        """HEAD 요청으로 파일 정보 조회"""
         try:
             response = await self._run_async(
                 self.s3_client.head_object,
@@ -150,28 +321,50 @@ class S3StorageService(BaseStorageService):
     async def list_files(self, prefix: str = "", limit: int = 100) -> List[FileInfo]:
         """파일 목록 조회"""
         try:
-            response = await self._run_async(
-                self.s3_client.list_objects_v2,
-                Bucket=self.bucket_name,
-                Prefix=prefix,
-                MaxKeys=limit
-            )
-            
             files = []
-            for obj in response.get('Contents', []):
-                files.append(FileInfo(
-                    key=obj['Key'],
-                    size=obj['Size'],
-                    content_type=self.get_content_type(obj['Key']),
-                    etag=obj.get('ETag', '').strip('"'),
-                    last_modified=obj.get('LastModified').isoformat() if obj.get('LastModified') else None
-                ))
+            async for file_info in self.iter_files(prefix=prefix, max_items=limit):
+                files.append(file_info)
             
             return files
             
         except Exception:
             return []
     
+    async def iter_files(self, prefix: str = "", max_items: Optional[int] = None) -> AsyncIterator[FileInfo]:
+        """파일 목록 스트리밍 조회 (list_objects_v2 페이지 단위로 지연 조회)"""
+        pagination_config = {}
+        if max_items is not None:
+            pagination_config = {'MaxItems': max_items, 'PageSize': min(max_items, 1000)}
+        
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = iter(paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            PaginationConfig=pagination_config
+        ))
+        
+        # 목록 내에서는 확장자별 Content-Type을 한 번만 계산
+        content_types: Dict[str, str] = {}
+        
+        while True:
+            page = await self._run_async(next, pages, None)
+            if page is None:
+                break
+            
+            for obj in page.get('Contents', []):
+                ext = os.path.splitext(obj['Key'])[1].lower()
+                content_type = content_types.get(ext)
+                if content_type is None:
+                    content_type = content_types[ext] = self.get_content_type(obj['Key'])
+                
+                yield FileInfo(
+                    key=obj['Key'],
+                    size=obj['Size'],
+                    content_type=content_type,
+                    etag=obj.get('ETag', '').strip('"'),
+                    last_modified=obj.get('LastModified').isoformat() if obj.get('LastModified') else None
+                )
+    
     async def get_download_url(self, key: str, expires_in: int = 3600) -> Optional[str]:
         """다운로드 URL 생성 (Pre-signed URL)"""
         try:
@@ -215,43 +408,17 @@ class S3StorageService(BaseStorageService):
             if not settings.CLOUDFRONT_DOMAIN:
                 return None
             
-            from botocore.signers import CloudFrontSigner
-            import rsa
-            import os
-            import boto3
-            
-            # 프라이빗 키 로드 (우선순위: Secrets Manager > 파일 경로)
-            private_key_pem: Optional[bytes] = None
-            secret_id = getattr(settings, 'CLOUDFRONT_PRIVATE_KEY_SECRET_ID', None)
-            if secret_id:
-                try:
-                    sm = boto3.client('secretsmanager', region_name=settings.AWS_REGION)
-                    sec = sm.get_secret_value(SecretId=secret_id)
-                    secret_string = sec.get('SecretString')
-                    if secret_string:
-                        private_key_pem = secret_string.encode('utf-8')
-                    elif 'SecretBinary' in sec:
-                        private_key_pem = sec['SecretBinary']
-                except Exception:
-                    private_key_pem = None
-            if private_key_pem is None and getattr(settings, 'CLOUDFRONT_PRIVATE_KEY_PATH', None) and os.path.exists(settings.CLOUDFRONT_PRIVATE_KEY_PATH):
-                with open(settings.CLOUDFRONT_PRIVATE_KEY_PATH, 'rb') as key_file:
-                    private_key_pem = key_file.read()
-            if not private_key_pem:
+            cloudfront_signer = await self._get_cf_signer()
+            if cloudfront_signer is None:
                 return None
-            private_key = rsa.PrivateKey.load_pkcs1(private_key_pem)
-            
-            def rsa_signer(message):
-                return rsa.sign(message, private_key, 'SHA-1')
             
             # CloudFront URL
             url = f"https://{settings.CLOUDFRONT_DOMAIN}/{key}"
             
             # 만료 시간 설정
-            expire_date = datetime.utcnow() + timedelta(seconds=expires_in)
+            expire_date = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
             
             # Signed URL 생성
-            cloudfront_signer = CloudFrontSigner(settings.CLOUDFRONT_KEY_PAIR_ID, rsa_signer)
             signed_url = cloudfront_signer.generate_presigned_url(url, date_less_than=expire_date)
             
             return signed_url
@@ -260,7 +427,50 @@ class S3StorageService(BaseStorageService):
             print(f"Error generating CloudFront signed URL: {e}")
             return None
     
-    async def health_check(self) -> Dict[str, any]:
+    async def _get_cf_signer(self):
+        """CloudFront 서명기 조회 (최초 호출 시에만 프라이빗 키를 로드하고 이후 재사용)"""
+        if self._cf_signer is not None:
+            return self._cf_signer
+        
+        async with self._cf_signer_lock:
+            if self._cf_signer is None:
+                self._cf_signer = await self._run_async(self._load_cf_signer)
+        return self._cf_signer
+    
+    def _load_cf_signer(self):
+        """프라이빗 키를 읽어 CloudFront 서명기 생성 (동기 I/O)"""
+        from botocore.signers import CloudFrontSigner
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import padding
+        
+        # 프라이빗 키 로드 (우선순위: Secrets Manager > 파일 경로)
+        private_key_pem: Optional[bytes] = None
+        secret_id = getattr(settings, 'CLOUDFRONT_PRIVATE_KEY_SECRET_ID', None)
+        if secret_id:
+            try:
+                sm = boto3.client('secretsmanager', region_name=settings.AWS_REGION)
+                sec = sm.get_secret_value(SecretId=secret_id)
+                secret_string = sec.get('SecretString')
+                if secret_string:
+                    private_key_pem = secret_string.encode('utf-8')
+                elif 'SecretBinary' in sec:
+                    private_key_pem = sec['SecretBinary']
+            except Exception:
+                private_key_pem = None
+        if private_key_pem is None and getattr(settings, 'CLOUDFRONT_PRIVATE_KEY_PATH', None) and os.path.exists(settings.CLOUDFRONT_PRIVATE_KEY_PATH):
+            with open(settings.CLOUDFRONT_PRIVATE_KEY_PATH, 'rb') as key_file:
+                private_key_pem = key_file.read()
+        if not private_key_pem:
+            return None
+        private_key = serialization.load_pem_private_key(private_key_pem, password=None)
+        
+        def rsa_signer(message):
+            # CloudFront 서명 URL은 RSA-SHA1 서명을 요구함 (OpenSSL 기반으로 서명)
+            return private_key.sign(message, padding.PKCS1v15(), hashes.SHA1())
+        
+        return CloudFrontSigner(settings.CLOUDFRONT_KEY_PAIR_ID, rsa_signer)
+    
+    async def health_check(self) -> Dict[str, Any]:
         """S3 연결 상태 확인"""
         try:
             # 버킷 존재 확인
@@ -3,18 +3,33 @@ WebSocket 기반 실시간 로그 스트리밍 서비스
 """
 from __future__ import annotations
 
-import json
 import asyncio
 import logging
 from typing import Dict, Set, List, Any, Optional
 from datetime import datetime, timezone
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from collections import deque
+from itertools import islice
+from functools import lru_cache
 from enum import Enum
 import uuid
-import threading
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
+# 연결당 전송 제한 시간(초)과 전송 대기열 크기 (가득 차면 느린 연결로 보고 해제)
+_SEND_TIMEOUT = 5.0
+_OUTBOX_SIZE = 256
+
+# 로그 묶음 전송 주기(초)와 한 프레임에 담을 최대 로그 수
+_FLUSH_INTERVAL = 0.05
+_MAX_BATCH_SIZE = 128
+
+
+def _encode(message: Dict[str, Any]) -> str:
+    """전송용 JSON 직렬화 (orjson 사용, 프론트엔드가 텍스트 프레임을 기대하므로 str 반환)"""
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
 
 class LogLevel(Enum):
     """로그 레벨"""
@@ -47,12 +62,41 @@ class LogMessage:
     job_id: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환"""
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        data['level'] = self.level.value
-        data['category'] = self.category.value
-        return data
+        """딕셔너리로 변환 (asdict의 재귀 복사 없이 필드를 직접 구성, details는 참조 공유)"""
+        return {
+            "id": self.id,
+            "timestamp": self.timestamp.isoformat(),
+            "level": self.level.value,
+            "category": self.category.value,
+            "message": self.message,
+            "details": self.details,
+            "chapter_id": self.chapter_id,
+            "book_id": self.book_id,
+            "job_id": self.job_id
+        }
+
+
+# 로깅 레벨 -> 로그 레벨 매핑
+_LEVEL_MAPPING = {
+    logging.DEBUG: LogLevel.DEBUG,
+    logging.INFO: LogLevel.INFO,
+    logging.WARNING: LogLevel.WARNING,
+    logging.ERROR: LogLevel.ERROR,
+    logging.CRITICAL: LogLevel.CRITICAL
+}
+
+# 로그 레코드에서 details로 옮길 추가 필드
+_DETAIL_FIELDS = ("chapter_id", "book_id", "job_id")
+
+
+@lru_cache(maxsize=256)
+def _category_for_logger(logger_name: str) -> Optional[LogCategory]:
+    """로거 이름으로 결정되는 카테고리 (없으면 None, 레벨로 결정)"""
+    if "upload" in logger_name:
+        return LogCategory.UPLOAD
+    if "processing" in logger_name:
+        return LogCategory.PROCESSING
+    return None
 
 
 class WebSocketLogStreamer:
@@ -61,9 +105,24 @@ class WebSocketLogStreamer:
     def __init__(self):
         self.connections: Dict[str, WebSocket] = {}
         self.subscriptions: Dict[str, Set[str]] = {}  # connection_id -> {chapter_ids}
-        self.log_history: List[LogMessage] = []
+        
+        # 브로드캐스트 대상 역인덱스 (구독 변경 시 함께 갱신)
+        self._chapter_index: Dict[str, Set[str]] = {}  # chapter_id -> {connection_ids}
+        self._global_subs: Set[str] = set()  # 챕터 구독이 없는(전체 로그) 연결
         self.max_history = 1000
-        self.lock = threading.Lock()
+        self.log_history: deque[LogMessage] = deque(maxlen=self.max_history)
+        
+        # 연결별 전송 대기열과 전송 태스크 (느린 연결이 다른 연결에 영향을 주지 않도록 분리)
+        self._outboxes: Dict[str, asyncio.Queue] = {}
+        self._sender_tasks: Dict[str, asyncio.Task] = {}
+        self._closing_tasks: Set[asyncio.Task] = set()
+        
+        # 전송 대기 중인 로그 (주기적으로 묶어서 브로드캐스트)
+        self._pending_logs: List[LogMessage] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # 연결/구독/히스토리는 이벤트 루프 스레드에서만 변경 (다른 스레드의 로그는 루프로 전달)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         # 로그 핸들러 설정
         self.log_handler = WebSocketLogHandler(self)
@@ -72,13 +131,21 @@ class WebSocketLogStreamer:
     async def connect(self, websocket: WebSocket, connection_id: Optional[str] = None) -> str:
         """WebSocket 연결"""
         await websocket.accept()
+        self._loop = asyncio.get_running_loop()
         
         if not connection_id:
             connection_id = str(uuid.uuid4())
         
-        with self.lock:
-            self.connections[connection_id] = websocket
-            self.subscriptions[connection_id] = set()
+        self._drop_subscriptions(connection_id)
+        self._stop_sender(connection_id)
+        self.connections[connection_id] = websocket
+        outbox: asyncio.Queue = asyncio.Queue(maxsize=_OUTBOX_SIZE)
+        self._outboxes[connection_id] = outbox
+        self._sender_tasks[connection_id] = asyncio.create_task(
+            self._sender_loop(connection_id, websocket, outbox)
+        )
+        self.subscriptions[connection_id] = set()
+        self._global_subs.add(connection_id)
         
         # 연결 환영 메시지
         await self.send_to_connection(connection_id, {
@@ -96,19 +163,19 @@ class WebSocketLogStreamer:
     
     async def disconnect(self, connection_id: str) -> None:
         """WebSocket 연결 해제"""
-        with self.lock:
-            if connection_id in self.connections:
-                del self.connections[connection_id]
-            if connection_id in self.subscriptions:
-                del self.subscriptions[connection_id]
+        if connection_id in self.connections:
+            del self.connections[connection_id]
+        self._drop_subscriptions(connection_id)
+        self._stop_sender(connection_id)
         
         self.logger.info(f"WebSocket disconnected: {connection_id}")
     
     async def subscribe_to_chapter(self, connection_id: str, chapter_id: str) -> None:
         """특정 챕터 로그 구독"""
-        with self.lock:
-            if connection_id in self.subscriptions:
-                self.subscriptions[connection_id].add(chapter_id)
+        if connection_id in self.subscriptions:
+            self.subscriptions[connection_id].add(chapter_id)
+            self._chapter_index.setdefault(chapter_id, set()).add(connection_id)
+            self._global_subs.discard(connection_id)
         
         await self.send_to_connection(connection_id, {
             "type": "subscription",
@@ -119,9 +186,12 @@ class WebSocketLogStreamer:
     
     async def unsubscribe_from_chapter(self, connection_id: str, chapter_id: str) -> None:
         """챕터 로그 구독 해제"""
-        with self.lock:
-            if connection_id in self.subscriptions:
-                self.subscriptions[connection_id].discard(chapter_id)
+        if connection_id in self.subscriptions:
+            subscribed_chapters = self.subscriptions[connection_id]
+            subscribed_chapters.discard(chapter_id)
+            self._unindex(chapter_id, connection_id)
+            if not subscribed_chapters:
+                self._global_subs.add(connection_id)
         
         await self.send_to_connection(connection_id, {
             "type": "subscription", 
@@ -130,55 +200,159 @@ class WebSocketLogStreamer:
             "message": f"Unsubscribed from chapter {chapter_id} logs"
         })
     
+    def _drop_subscriptions(self, connection_id: str) -> None:
+        """연결의 구독 정보와 역인덱스 항목 제거"""
+        for chapter_id in self.subscriptions.pop(connection_id, ()):
+            self._unindex(chapter_id, connection_id)
+        self._global_subs.discard(connection_id)
+    
+    def _unindex(self, chapter_id: str, connection_id: str) -> None:
+        """챕터 역인덱스에서 연결 제거 (비면 챕터 항목도 삭제)"""
+        subscribers = self._chapter_index.get(chapter_id)
+        if subscribers is not None:
+            subscribers.discard(connection_id)
+            if not subscribers:
+                del self._chapter_index[chapter_id]
+    
     async def send_to_connection(self, connection_id: str, message: Dict[str, Any]) -> bool:
-        """특정 연결로 메시지 전송"""
-        with self.lock:
-            websocket = self.connections.get(connection_id)
+        """특정 연결로 메시지 전송 (직렬화할 수 없는 메시지는 전송하지 않고 False 반환)"""
+        try:
+            text = _encode(message)
+        except TypeError as e:
+            # orjson은 지원하지 않는 타입에서 예외를 던지므로 연결(엔드포인트)까지 전파하지 않음
+            self.logger.warning(f"Skipping unserializable message for {connection_id}: {e}")
+            return False
+        return await self._send_text(connection_id, text)
+    
+    async def _send_text(self, connection_id: str, text: str) -> bool:
+        """이미 직렬화된 메시지를 연결의 전송 대기열에 추가"""
+        outbox = self._outboxes.get(connection_id)
+        if outbox is None:
+            return False
         
-        if websocket:
-            try:
-                await websocket.send_text(json.dumps(message))
-                return True
-            except Exception as e:
-                self.logger.error(f"Failed to send message to {connection_id}: {e}")
-                # 연결 정리
-                await self.disconnect(connection_id)
+        try:
+            outbox.put_nowait(text)
+            return True
+        except asyncio.QueueFull:
+            self.logger.warning(f"Send queue full, dropping slow connection: {connection_id}")
+            await self._drop_connection(connection_id)
+            return False
+    
+    async def _sender_loop(self, connection_id: str, websocket: WebSocket, outbox: asyncio.Queue) -> None:
+        """연결별 전송 태스크 (대기열의 메시지를 순서대로 전송)"""
+        try:
+            # 대기열이 교체/제거되면 종료 (wait_for가 취소를 삼키는 경우에도 태스크가 남지 않도록)
+            while self._outboxes.get(connection_id) is outbox:
+                text = await outbox.get()
+                await asyncio.wait_for(websocket.send_text(text), timeout=_SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Failed to send message to {connection_id}: {e}")
+            # 연결 정리
+            await self._drop_connection(connection_id)
+    
+    async def _drop_connection(self, connection_id: str) -> None:
+        """느리거나 끊긴 연결 정리 (대기열을 비우고 소켓도 닫아 클라이언트가 재연결하도록 함)"""
+        websocket = self.connections.get(connection_id)
+        outbox = self._outboxes.get(connection_id)
+        if outbox is not None:
+            while not outbox.empty():
+                outbox.get_nowait()
+        
+        await self.disconnect(connection_id)
         
-        return False
+        if websocket is not None:
+            # 전송이 막힌 연결일 수 있으므로 닫기는 별도 태스크에서 제한 시간 내로 시도
+            task = asyncio.create_task(self._close_websocket(connection_id, websocket))
+            self._closing_tasks.add(task)
+            task.add_done_callback(self._closing_tasks.discard)
+    
+    async def _close_websocket(self, connection_id: str, websocket: WebSocket) -> None:
+        """WebSocket 닫기 (1013: 잠시 후 다시 시도)"""
+        try:
+            await asyncio.wait_for(websocket.close(code=1013), timeout=_SEND_TIMEOUT)
+        except Exception as e:
+            self.logger.debug(f"Failed to close WebSocket {connection_id}: {e}")
+    
+    def _stop_sender(self, connection_id: str) -> None:
+        """연결의 전송 태스크 취소 및 대기열 제거"""
+        self._outboxes.pop(connection_id, None)
+        task = self._sender_tasks.pop(connection_id, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
     
     async def broadcast_log(self, log_message: LogMessage) -> None:
         """로그 메시지 브로드캐스트"""
-        # 로그 히스토리에 추가
-        with self.lock:
-            self.log_history.append(log_message)
-            
-            # 히스토리 크기 제한
-            if len(self.log_history) > self.max_history:
-                self.log_history = self.log_history[-self.max_history:]
+        await self.broadcast_logs([log_message])
+    
+    async def broadcast_logs(self, log_messages: List[LogMessage]) -> None:
+        """로그 메시지 묶음 브로드캐스트 (연결별로 해당 로그만 한 프레임에 전송)"""
+        # 로그별로 한 번씩 직렬화 (직렬화할 수 없는 details가 있는 로그만 건너뜀)
+        encoded_logs: List[str] = []
+        sendable: List[LogMessage] = []
+        for log_message in log_messages:
+            try:
+                encoded_logs.append(_encode(log_message.to_dict()))
+            except TypeError as e:
+                self.logger.warning(f"Skipping log that cannot be serialized ({log_message.id}): {e}")
+                continue
+            sendable.append(log_message)
         
-        # 관련 연결들에게 전송
-        message_data = {
-            "type": "log",
-            "data": log_message.to_dict()
-        }
+        if not sendable:
+            return
         
-        connections_to_send = []
+        # 로그 히스토리에 추가 (maxlen 초과 시 오래된 항목 자동 제거)
+        self.log_history.extend(sendable)
         
-        with self.lock:
-            for connection_id, subscribed_chapters in self.subscriptions.items():
-                # 전체 구독 또는 해당 챕터 구독
-                if (not subscribed_chapters or 
-                    (log_message.chapter_id and log_message.chapter_id in subscribed_chapters)):
-                    connections_to_send.append(connection_id)
+        # 같은 로그 조합을 받는 연결끼리는 프레임 문자열을 공유
+        payloads: Dict[tuple, str] = {}
+        texts_to_send = []
         
-        # 비동기적으로 메시지 전송
-        for connection_id in connections_to_send:
-            await self.send_to_connection(connection_id, message_data)
+        # 역인덱스로 수신 대상 계산 (전체 구독 연결은 모든 로그, 챕터 구독 연결은 해당 로그만)
+        targets: Dict[str, List[int]] = {}
+        for i, log_message in enumerate(sendable):
+            if log_message.chapter_id:
+                for connection_id in self._chapter_index.get(log_message.chapter_id, ()):
+                    targets.setdefault(connection_id, []).append(i)
+        
+        all_logs = tuple(range(len(sendable)))
+        recipients = [(connection_id, all_logs) for connection_id in self._global_subs]
+        recipients.extend((connection_id, tuple(matched)) for connection_id, matched in targets.items())
+        
+        for connection_id, matched in recipients:
+            text = payloads.get(matched)
+            if text is None:
+                # 로그별 직렬화 결과를 이어 붙여 프레임 구성 (묶음마다 다시 직렬화하지 않음)
+                if len(matched) == 1:
+                    text = '{"type":"log","data":' + encoded_logs[matched[0]] + '}'
+                else:
+                    text = '{"type":"log_batch","data":[' + ",".join(encoded_logs[i] for i in matched) + ']}'
+                payloads[matched] = text
+            texts_to_send.append((connection_id, text))
+        
+        # 연결별 대기열에 넣고 바로 반환 (실제 전송은 연결별 전송 태스크가 담당)
+        for connection_id, text in texts_to_send:
+            await self._send_text(connection_id, text)
+    
+    async def _flush_pending_logs(self) -> None:
+        """대기 중인 로그를 주기적으로 묶어서 브로드캐스트 (새 로그가 없으면 종료)"""
+        try:
+            while True:
+                await asyncio.sleep(_FLUSH_INTERVAL)
+                if not self._pending_logs:
+                    break
+                
+                pending, self._pending_logs = self._pending_logs, []
+                for i in range(0, len(pending), _MAX_BATCH_SIZE):
+                    await self.broadcast_logs(pending[i:i + _MAX_BATCH_SIZE])
+        finally:
+            self._flush_task = None
     
     async def send_log_history(self, connection_id: str, limit: int = 50) -> None:
         """로그 히스토리 전송"""
-        with self.lock:
-            recent_logs = self.log_history[-limit:] if self.log_history else []
+        # 뒤에서부터 limit개만 꺼냄 (전체 복사 없이)
+        recent_logs = list(islice(reversed(self.log_history), limit))[::-1] if limit > 0 else []
         
         if recent_logs:
             history_data = {
@@ -205,21 +379,33 @@ class WebSocketLogStreamer:
             job_id=job_id
         )
         
-        # 비동기 브로드캐스트를 위한 태스크 생성
-        asyncio.create_task(self.broadcast_log(log_message))
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # 이벤트 루프 밖(워커 스레드 등)에서 호출된 경우 루프 스레드로 전달
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._enqueue_log, log_message)
+            return
+        
+        self._enqueue_log(log_message)
+    
+    def _enqueue_log(self, log_message: LogMessage) -> None:
+        """전송 대기열에 추가하고 묶음 전송 태스크가 없으면 생성 (이벤트 루프 스레드 전용)"""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_pending_logs())
+        self._pending_logs.append(log_message)
     
     def get_connection_stats(self) -> Dict[str, Any]:
         """연결 통계"""
-        with self.lock:
-            total_connections = len(self.connections)
-            total_subscriptions = sum(len(subs) for subs in self.subscriptions.values())
-            
-            return {
-                "total_connections": total_connections,
-                "total_subscriptions": total_subscriptions,
-                "log_history_size": len(self.log_history),
-                "max_history": self.max_history
-            }
+        total_connections = len(self.connections)
+        total_subscriptions = sum(len(subs) for subs in self.subscriptions.values())
+        
+        return {
+            "total_connections": total_connections,
+            "total_subscriptions": total_subscriptions,
+            "log_history_size": len(self.log_history),
+            "max_history": self.max_history
+        }
 
 
 class WebSocketLogHandler(logging.Handler):
@@ -233,34 +419,18 @@ class WebSocketLogHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
         """로그 레코드를 WebSocket으로 전송"""
         try:
-            # 로그 레벨 매핑
-            level_mapping = {
-                logging.DEBUG: LogLevel.DEBUG,
-                logging.INFO: LogLevel.INFO,
-                logging.WARNING: LogLevel.WARNING,
-                logging.ERROR: LogLevel.ERROR,
-                logging.CRITICAL: LogLevel.CRITICAL
-            }
-            
-            level = level_mapping.get(record.levelno, LogLevel.INFO)
+            level = _LEVEL_MAPPING.get(record.levelno, LogLevel.INFO)
             
-            # 카테고리 추출 (로거 이름에서)
-            category = LogCategory.SYSTEM
-            if "upload" in record.name:
-                category = LogCategory.UPLOAD
-            elif "processing" in record.name:
-                category = LogCategory.PROCESSING
-            elif record.levelno >= logging.ERROR:
-                category = LogCategory.ERROR
+            # 카테고리 추출 (로거 이름별 결과는 캐시)
+            category = _category_for_logger(record.name)
+            if category is None:
+                category = LogCategory.ERROR if record.levelno >= logging.ERROR else LogCategory.SYSTEM
             
             # 추가 정보 추출
-            details = {}
-            if hasattr(record, 'chapter_id'):
-                details['chapter_id'] = record.chapter_id
-            if hasattr(record, 'book_id'):
-                details['book_id'] = record.book_id
-            if hasattr(record, 'job_id'):
-                details['job_id'] = record.job_id
+            record_dict = record.__dict__
+            details = {
+                key: record_dict[key] for key in _DETAIL_FIELDS if key in record_dict
+            }
             
             # WebSocket으로 전송
             self.streamer.add_log(
@@ -268,9 +438,9 @@ class WebSocketLogHandler(logging.Handler):
                 category=category,
                 message=record.getMessage(),
                 details=details if details else None,
-                chapter_id=getattr(record, 'chapter_id', None),
-                book_id=getattr(record, 'book_id', None),
-                job_id=getattr(record, 'job_id', None)
+                chapter_id=details.get('chapter_id'),
+                book_id=details.get('book_id'),
+                job_id=details.get('job_id')
             )
             
         except Exception as e:
@@ -278,12 +448,29 @@ class WebSocketLogHandler(logging.Handler):
             print(f"WebSocket log handler error: {e}")
 
 
-# 전역 로그 스트리머
-log_streamer = WebSocketLogStreamer()
+# 전역 로그 스트리머 (처음 사용할 때 생성하여 WS 로깅을 쓰지 않는 프로세스의 import 비용 제거)
+_log_streamer: Optional[WebSocketLogStreamer] = None
+
+
+def get_log_streamer() -> WebSocketLogStreamer:
+    """전역 로그 스트리머 반환 (최초 호출 시 생성)"""
+    global _log_streamer
+    if _log_streamer is None:
+        _log_streamer = WebSocketLogStreamer()
+    return _log_streamer
+
+
+def __getattr__(name: str) -> Any:
+    # 기존 `from ... import log_streamer` 호환
+    if name == "log_streamer":
+        return get_log_streamer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def setup_websocket_logging() -> None:
     """WebSocket 로깅 설정"""
+    log_streamer = get_log_streamer()
+    
     # 루트 로거에 WebSocket 핸들러 추가
     root_logger = logging.getLogger()
     root_logger.addHandler(log_streamer.log_handler)
@@ -304,7 +491,7 @@ def add_upload_log(message: str, level: LogLevel = LogLevel.INFO,
                   chapter_id: Optional[str] = None, book_id: Optional[str] = None,
                   details: Optional[Dict[str, Any]] = None) -> None:
     """업로드 로그 추가 (편의 함수)"""
-    log_streamer.add_log(
+    get_log_streamer().add_log(
         level=level,
         category=LogCategory.UPLOAD,
         message=message,
@@ -317,7 +504,7 @@ def add_upload_log(message: str, level: LogLevel = LogLevel.INFO,
 def add_error_log(message: str, chapter_id: Optional[str] = None,
                  details: Optional[Dict[str, Any]] = None) -> None:
     """에러 로그 추가 (편의 함수)"""
-    log_streamer.add_log(
+    get_log_streamer().add_log(
         level=LogLevel.ERROR,
         category=LogCategory.ERROR,
         message=message,
@@ -328,4 +515,4 @@ def add_error_log(message: str, chapter_id: Optional[str] = None,
 
 def get_log_streamer_stats() -> Dict[str, Any]:
     """로그 스트리머 통계 (편의 함수)"""
-    return log_streamer.get_connection_stats()
+    return get_log_streamer().get_connection_stats()
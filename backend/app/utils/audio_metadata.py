@@ -2,8 +2,8 @@
 from __future__ import annotations
 
 import os
-from pathlib import Path
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, Optional
 
 
 _DEFAULTS: Dict[str, Any] = {
@@ -13,17 +13,108 @@ _DEFAULTS: Dict[str, Any] = {
     "channels": None,
 }
 
+# RIFF 헤더 / ftyp 박스 확인에 필요한 앞부분 크기
+_HEADER_PEEK_SIZE = 12
+
+# fmt 청크를 찾기 위해 따라갈 최대 청크 수 (JUNK/bext/LIST 등이 앞에 올 수 있음)
+_WAV_MAX_CHUNKS = 16
+
+# MP4/M4A 컨테이너로 취급하는 ftyp major brand
+_MP4_BRANDS = {b"M4A ", b"mp42", b"isom"}
+
+
+def _read_wav_format(f: BinaryIO, header: bytes) -> Optional[Dict[str, Any]]:
+    """RIFF/WAVE 청크를 따라가 fmt 청크에서 채널/샘플레이트/비트레이트를 읽는다.
+
+    WAV가 아니거나 data 청크 전까지 fmt 청크를 찾지 못하면 None. f는 header 바로 뒤에 위치해야 한다.
+    """
+    if len(header) < _HEADER_PEEK_SIZE or header[0:4] != b"RIFF" or header[8:12] != b"WAVE":
+        return None
+
+    for _ in range(_WAV_MAX_CHUNKS):
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            return None
+        chunk_id = chunk_header[0:4]
+        chunk_size = int.from_bytes(chunk_header[4:8], "little")
+
+        if chunk_id == b"fmt ":
+            fmt = f.read(16) if chunk_size >= 16 else b""
+            if len(fmt) < 16:
+                return None
+            channels = int.from_bytes(fmt[2:4], "little")
+            sample_rate = int.from_bytes(fmt[4:8], "little")
+            byte_rate = int.from_bytes(fmt[8:12], "little")
+            return {
+                "format": "wav",
+                "bitrate": byte_rate * 8 // 1000,
+                "sample_rate": sample_rate,
+                "channels": channels,
+            }
+        if chunk_id == b"data":
+            return None
+
+        # 청크는 2바이트 정렬 (홀수 크기면 패딩 1바이트)
+        f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+    return None
+
+
+def _peek_mp4_brand(header: bytes) -> bool:
+    """ftyp 박스의 major brand로 MP4/M4A 컨테이너 여부를 판단한다."""
+    return len(header) >= 12 and header[4:8] == b"ftyp" and header[8:12] in _MP4_BRANDS
+
+
+def _quick_format_hint(file_path: str, extension: Optional[str]) -> Optional[Dict[str, Any]]:
+    """파일 앞부분만 읽어 포맷 힌트를 반환한다.
+
+    ffprobe 프로세스를 띄우지 않고 헤더 바이트만 확인한다. 알 수 없는 포맷이거나
+    읽기에 실패하면 None을 반환한다.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            header = f.read(_HEADER_PEEK_SIZE)
+            wav_info = _read_wav_format(f, header)
+    except OSError:
+        return None
+
+    if wav_info:
+        return wav_info
+
+    if _peek_mp4_brand(header):
+        return {"format": extension if extension in ("m4a", "mp4") else "mp4"}
+
+    return None
+
+
+@lru_cache(maxsize=512)
+def _cached_format_hint(
+    file_path: str, mtime_ns: int, size: int, extension: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """(경로, 수정 시각, 크기) 기준으로 헤더 힌트를 캐시한다. 파일이 바뀌면 키가 달라져 다시 읽는다."""
+    return _quick_format_hint(file_path, extension)
+
 
 def extract_audio_metadata(file_path: str) -> Dict[str, Any]:
-    """Return best-effort metadata using only filename hints.
+    """Return best-effort metadata using filename and header hints.
 
     The current MVP는 인코딩/트랜스코딩 기능을 사용하지 않으므로, FFmpeg/ffprobe에 의존하지 않고
-    확장자 기반으로 format 정도만 식별한다. 나머지 필드는 기본값으로 채운다.
+    확장자와 헤더 바이트로 format 정도만 식별한다. WAV 파일은 헤더에서 채널/샘플레이트/비트레이트를
+    읽고, 나머지 필드는 기본값으로 채운다.
     """
-    extension = Path(file_path).suffix.lstrip(".").lower() or None
+    extension = os.path.splitext(file_path)[1].lstrip(".").lower() or None
 
     metadata = dict(_DEFAULTS)
     metadata["format"] = extension
+
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        hint = None
+    else:
+        hint = _cached_format_hint(file_path, stat.st_mtime_ns, stat.st_size, extension)
+    if hint:
+        metadata.update(hint)
     return metadata
 
 
@@ -4,13 +4,42 @@
 from __future__ import annotations
 
 import os
+import re
 import mimetypes
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
 from app.core.config import settings
 
 
+# sanitize_filename: 안전하지 않은 문자 치환 테이블과 연속 공백/언더스코어 축약 정규식
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+_COLLAPSE_RE = re.compile(r'(\s+)|__+')
+
+# 챕터 번호 패턴 (모듈 로드 시 1회 컴파일, 앞에서부터 우선 적용)
+_CHAPTER_PATTERNS = [
+    (re.compile(r'(\d+)_(\d+)', re.IGNORECASE), lambda m: int(m.group(2))),  # "1_1" → 1
+    (re.compile(r'chapter\s*(\d+)', re.IGNORECASE), lambda m: int(m.group(1))),  # "Chapter 1" → 1
+    (re.compile(r'(\d+)장', re.IGNORECASE), lambda m: int(m.group(1))),  # "1장" → 1
+    (re.compile(r'(\d+)편', re.IGNORECASE), lambda m: int(m.group(1))),  # "1편" → 1
+    (re.compile(r'(\d+)회', re.IGNORECASE), lambda m: int(m.group(1))),  # "1회" → 1
+    (re.compile(r'^(\d+)', re.IGNORECASE), lambda m: int(m.group(1))),  # 시작 숫자 → 숫자
+]
+
+# 파일명에 허용하지 않는 문자 삭제 테이블 (translate 한 번으로 포함 여부 확인)
+_UNSAFE_CHARS_TABLE = str.maketrans('', '', '<>:"|?*\\/')
+
+# 제어 문자(코드 포인트 32 미만) 삭제 테이블
+_CONTROL_CHARS_TABLE = str.maketrans('', '', ''.join(map(chr, range(32))))
+
+
+def _get_extension(filename: str) -> str:
+    """마지막 점 이후를 소문자 확장자로 반환 (점이 없으면 빈 문자열)"""
+    _, sep, ext = filename.rpartition('.')
+    return '.' + ext.lower() if sep else ''
+
+
 @dataclass
 class AudioValidationResult:
     """오디오 검증 결과"""
@@ -45,6 +74,20 @@ class AudioFileValidator:
         b'\x00\x00\x00\x20ftypM4A': 'm4a',  # M4A
     }
     
+    # 스트리밍 검증 시 읽어야 하는 앞부분 크기 (시그니처/ID3 헤더 확인용)
+    HEADER_READ_SIZE = 4096
+    
+    # startswith에 한 번에 넘길 시그니처 튜플 (C 레벨에서 모든 접두사 비교)
+    _SIGNATURE_PREFIXES = tuple(FILE_SIGNATURES)
+    
+    # 확장자별로 먼저 확인할 시그니처 (일치하지 않으면 전체 검사로 넘어감)
+    _EXTENSION_SIGNATURES = {
+        '.mp3': (b'\xFF\xFB', b'\xFF\xF3', b'\xFF\xF2'),
+        '.wav': (b'RIFF',),
+        '.flac': (b'fLaC',),
+        '.m4a': (b'\x00\x00\x00\x20ftypM4A',),
+    }
+    
     def __init__(self, 
                  max_file_size: int = 100 * 1024 * 1024,  # 100MB
                  min_duration: int = 5,  # 5초
@@ -55,22 +98,40 @@ class AudioFileValidator:
         self.max_duration = max_duration
         self.allowed_extensions = allowed_extensions or ['.mp3', '.wav', '.m4a', '.flac']
     
-    def validate_file_basic(self, file_content: bytes, filename: str, content_type: str) -> AudioValidationResult:
-        """기본 파일 검증"""
-        errors = []
-        warnings = []
+    def validate_file_basic(self, file_content: bytes, filename: str, content_type: str,
+                            total_size: Optional[int] = None) -> AudioValidationResult:
+        """기본 파일 검증
+        
+        total_size를 지정하면 file_content는 파일 앞부분(HEADER_READ_SIZE)만 있어도 된다.
+        """
+        errors: List[str] = []
+        warnings: List[str] = []
+        self._check_file_basic(file_content, filename, content_type, total_size, errors, warnings)
+        
+        return AudioValidationResult(
+            is_valid=len(errors) == 0,
+            errors=errors,
+            warnings=warnings
+        )
+    
+    def _check_file_basic(self, file_content: bytes, filename: str, content_type: str,
+                          total_size: Optional[int], errors: List[str], warnings: List[str]) -> None:
+        """기본 파일 검증 항목 (결과는 errors/warnings에 추가)"""
+        file_size = len(file_content) if total_size is None else total_size
         
         # 파일 크기 검증
-        if len(file_content) > self.max_file_size:
+        if file_size > self.max_file_size:
             max_mb = self.max_file_size / (1024 * 1024)
-            current_mb = len(file_content) / (1024 * 1024)
+            current_mb = file_size / (1024 * 1024)
             errors.append(f"파일 크기 초과: {current_mb:.2f}MB > {max_mb:.0f}MB")
+            # 이미 거부된 파일이므로 나머지 항목은 검사하지 않음
+            return
         
-        if len(file_content) < 1024:  # 1KB 미만
+        if file_size < 1024:  # 1KB 미만
             errors.append("파일이 너무 작습니다. 유효한 오디오 파일인지 확인해주세요.")
         
         # 파일 확장자 검증
-        extension = '.' + filename.split('.')[-1].lower() if '.' in filename else ''
+        extension = _get_extension(filename)
         if extension not in self.allowed_extensions:
             errors.append(f"지원되지 않는 파일 형식: {extension}")
         
@@ -88,9 +149,20 @@ class AudioFileValidator:
             errors.append("파일명이 비어있습니다.")
         
         # 안전하지 않은 문자 검증
-        unsafe_chars = ['<', '>', ':', '"', '|', '?', '*', '\\', '/']
-        if any(char in filename for char in unsafe_chars):
+        if len(filename.translate(_UNSAFE_CHARS_TABLE)) != len(filename):
             errors.append("파일명에 안전하지 않은 문자가 포함되어 있습니다.")
+    
+    def validate_file_signature(self, file_content: bytes,
+                                total_size: Optional[int] = None, *,
+                                extension: Optional[str] = None) -> AudioValidationResult:
+        """파일 시그니처 검증
+        
+        total_size 지정 시 file_content는 파일 앞부분만 있어도 된다. extension(예: '.wav')을
+        지정하면 해당 형식의 시그니처부터 확인한다.
+        """
+        errors: List[str] = []
+        warnings: List[str] = []
+        self._check_file_signature(file_content, total_size, errors, warnings, extension)
         
         return AudioValidationResult(
             is_valid=len(errors) == 0,
@@ -98,57 +170,70 @@ class AudioFileValidator:
             warnings=warnings
         )
     
-    def validate_file_signature(self, file_content: bytes) -> AudioValidationResult:
-        """파일 시그니처 검증"""
-        errors = []
-        warnings = []
-        
+    def _check_file_signature(self, file_content: bytes, total_size: Optional[int],
+                              errors: List[str], warnings: List[str],
+                              extension: Optional[str] = None) -> None:
+        """파일 시그니처 검증 항목 (결과는 errors/warnings에 추가)"""
         # 파일이 너무 작으면 시그니처 검증 건너뛰기
         if len(file_content) < 12:
             warnings.append("파일이 너무 작아 시그니처를 검증할 수 없습니다.")
-            return AudioValidationResult(is_valid=True, errors=errors, warnings=warnings)
+            return
         
-        # 시그니처 확인
         header = file_content[:12]
-        signature_found = False
         
-        for signature, format_name in self.FILE_SIGNATURES.items():
-            if header.startswith(signature):
-                signature_found = True
-                break
-            # WAV의 경우 RIFF...WAVE 패턴 확인
-            if signature == b'RIFF' and len(header) >= 12:
-                if header[8:12] == b'WAVE':
-                    signature_found = True
-                    break
+        # 확장자에 맞는 시그니처면 바로 통과 (WAV/FLAC/M4A는 ID3 계산을 건너뜀)
+        expected_signatures = self._EXTENSION_SIGNATURES.get(extension) if extension else None
+        if expected_signatures and header.startswith(expected_signatures):
+            return
+        if extension == '.mp3' and self._has_id3_audio(file_content, total_size, warnings):
+            return
+        
+        # 알려진 시그니처 또는 WAV의 RIFF...WAVE 패턴 확인
+        signature_found = header.startswith(self._SIGNATURE_PREFIXES) or header[8:12] == b'WAVE'
+        
+        # ID3 태그가 있는 MP3 파일 확인
+        if not signature_found and extension != '.mp3':
+            signature_found = self._has_id3_audio(file_content, total_size, warnings)
         
         if not signature_found:
-            # ID3 태그가 있는 MP3 파일 확인
-            if header.startswith(b'ID3'):
-                # ID3 태그 크기 계산하여 실제 오디오 데이터 위치 찾기
-                if len(file_content) > 10:
-                    tag_size = (header[6] << 21) | (header[7] << 14) | (header[8] << 7) | header[9]
-                    audio_start = 10 + tag_size
-                    
-                    if len(file_content) > audio_start + 2:
-                        audio_header = file_content[audio_start:audio_start + 2]
-                        if audio_header[0] == 0xFF and (audio_header[1] & 0xE0) == 0xE0:
-                            signature_found = True
-            
-            if not signature_found:
-                errors.append("파일 시그니처가 올바르지 않습니다. 손상된 파일이거나 지원되지 않는 형식일 수 있습니다.")
+            errors.append("파일 시그니처가 올바르지 않습니다. 손상된 파일이거나 지원되지 않는 형식일 수 있습니다.")
+    
+    def _has_id3_audio(self, file_content: bytes, total_size: Optional[int], warnings: List[str]) -> bool:
+        """ID3 태그 뒤에 MP3 프레임이 이어지는지 확인"""
+        if not file_content.startswith(b'ID3') or len(file_content) <= 10:
+            return False
+        
+        # ID3 태그 크기 계산하여 실제 오디오 데이터 위치 찾기
+        tag_size = (file_content[6] << 21) | (file_content[7] << 14) | (file_content[8] << 7) | file_content[9]
+        audio_start = 10 + tag_size
+        
+        if len(file_content) > audio_start + 2:
+            audio_header = file_content[audio_start:audio_start + 2]
+            return audio_header[0] == 0xFF and (audio_header[1] & 0xE0) == 0xE0
+        
+        if total_size is not None and total_size > audio_start + 2:
+            # 앞부분만 받은 경우 프레임 헤더가 범위 밖이면 ID3 태그로 판단
+            warnings.append("ID3 태그 이후 오디오 프레임은 확인하지 못했습니다.")
+            return True
+        
+        return False
+    
+    def validate_audio_metadata(self, metadata: Dict[str, Any]) -> AudioValidationResult:
+        """오디오 메타데이터 검증"""
+        errors: List[str] = []
+        warnings: List[str] = []
+        self._check_audio_metadata(metadata, errors, warnings)
         
         return AudioValidationResult(
             is_valid=len(errors) == 0,
             errors=errors,
-            warnings=warnings
+            warnings=warnings,
+            file_info=metadata
         )
     
-    def validate_audio_metadata(self, metadata: Dict[str, Any]) -> AudioValidationResult:
-        """오디오 메타데이터 검증"""
-        errors = []
-        warnings = []
-        
+    def _check_audio_metadata(self, metadata: Dict[str, Any],
+                              errors: List[str], warnings: List[str]) -> None:
+        """오디오 메타데이터 검증 항목 (결과는 errors/warnings에 추가)"""
         duration = metadata.get('duration')
         bitrate = metadata.get('bitrate')
         sample_rate = metadata.get('sample_rate')
@@ -187,19 +272,22 @@ class AudioFileValidator:
                 warnings.append(f"다채널 오디오입니다: {channels}채널 (스테레오로 변환됩니다)")
         else:
             warnings.append("채널 정보를 확인할 수 없습니다.")
+    
+    def validate_filename_security(self, filename: str) -> AudioValidationResult:
+        """파일명 보안 검증"""
+        errors: List[str] = []
+        warnings: List[str] = []
+        self._check_filename_security(filename, errors, warnings)
         
         return AudioValidationResult(
             is_valid=len(errors) == 0,
             errors=errors,
-            warnings=warnings,
-            file_info=metadata
+            warnings=warnings
         )
     
-    def validate_filename_security(self, filename: str) -> AudioValidationResult:
-        """파일명 보안 검증"""
-        errors = []
-        warnings = []
-        
+    def _check_filename_security(self, filename: str,
+                                 errors: List[str], warnings: List[str]) -> None:
+        """파일명 보안 검증 항목 (결과는 errors/warnings에 추가)"""
         # 경로 순회 공격 방지
         if '..' in filename or filename.startswith('/') or filename.startswith('\\'):
             errors.append("안전하지 않은 파일명입니다.")
@@ -218,46 +306,35 @@ class AudioFileValidator:
             errors.append("파일명이 너무 깁니다. (UTF-8 기준 255바이트 초과)")
         
         # 제어 문자 확인
-        if any(ord(char) < 32 for char in filename):
+        if len(filename.translate(_CONTROL_CHARS_TABLE)) != len(filename):
             errors.append("파일명에 제어 문자가 포함되어 있습니다.")
-        
-        return AudioValidationResult(
-            is_valid=len(errors) == 0,
-            errors=errors,
-            warnings=warnings
-        )
     
     def validate_complete(self, 
                          file_content: bytes, 
                          filename: str, 
                          content_type: str,
-                         metadata: Optional[Dict[str, Any]] = None) -> AudioValidationResult:
-        """종합적인 검증"""
-        all_errors = []
-        all_warnings = []
+                         metadata: Optional[Dict[str, Any]] = None,
+                         total_size: Optional[int] = None) -> AudioValidationResult:
+        """종합적인 검증 (total_size 지정 시 file_content는 파일 앞부분만 있어도 됨)"""
+        # 각 검증 항목이 같은 목록에 바로 추가 (중간 결과 객체 생성 없음)
+        all_errors: List[str] = []
+        all_warnings: List[str] = []
         
         # 1. 기본 검증
-        basic_result = self.validate_file_basic(file_content, filename, content_type)
-        all_errors.extend(basic_result.errors)
-        all_warnings.extend(basic_result.warnings)
+        self._check_file_basic(file_content, filename, content_type, total_size, all_errors, all_warnings)
         
         # 2. 파일명 보안 검증
-        security_result = self.validate_filename_security(filename)
-        all_errors.extend(security_result.errors)
-        all_warnings.extend(security_result.warnings)
+        self._check_filename_security(filename, all_errors, all_warnings)
         
         # 3. 파일 시그니처 검증
-        signature_result = self.validate_file_signature(file_content)
-        all_errors.extend(signature_result.errors)
-        all_warnings.extend(signature_result.warnings)
+        self._check_file_signature(file_content, total_size, all_errors, all_warnings,
+                                   _get_extension(filename))
         
         # 4. 메타데이터 검증 (있는 경우)
         file_info = None
         if metadata:
-            metadata_result = self.validate_audio_metadata(metadata)
-            all_errors.extend(metadata_result.errors)
-            all_warnings.extend(metadata_result.warnings)
-            file_info = metadata_result.file_info
+            self._check_audio_metadata(metadata, all_errors, all_warnings)
+            file_info = metadata
         
         return AudioValidationResult(
             is_valid=len(all_errors) == 0,
@@ -274,14 +351,19 @@ audio_validator = AudioFileValidator()
 def validate_uploaded_audio(file_content: bytes, 
                            filename: str, 
                            content_type: str,
-                           metadata: Optional[Dict[str, Any]] = None) -> AudioValidationResult:
-    """업로드된 오디오 파일 검증 (편의 함수)"""
-    return audio_validator.validate_complete(file_content, filename, content_type, metadata)
+                           metadata: Optional[Dict[str, Any]] = None,
+                           total_size: Optional[int] = None) -> AudioValidationResult:
+    """업로드된 오디오 파일 검증 (편의 함수)
+    
+    업로드 전체를 메모리에 올리지 않으려면 file_content에 앞부분
+    (AudioFileValidator.HEADER_READ_SIZE 바이트)만 넘기고 total_size에 전체 크기를 지정한다.
+    """
+    return audio_validator.validate_complete(file_content, filename, content_type, metadata, total_size)
 
 
 def get_audio_file_info(filename: str, content_type: str) -> Dict[str, str]:
     """오디오 파일 기본 정보 추출"""
-    extension = '.' + filename.split('.')[-1].lower() if '.' in filename else ''
+    extension = _get_extension(filename)
     
     format_info = {
         '.mp3': {'format': 'MP3', 'codec': 'MPEG Audio Layer 3'},
@@ -300,21 +382,22 @@ def get_audio_file_info(filename: str, content_type: str) -> Dict[str, str]:
     }
 
 
+def _collapse_run(match: re.Match) -> str:
+    """_COLLAPSE_RE 치환 콜백 (공백 묶음이면 공백, 언더스코어 묶음이면 언더스코어)"""
+    return ' ' if match.group(1) else '_'
+
+
+@lru_cache(maxsize=1024)
 def sanitize_filename(filename: str) -> str:
     """파일명 정리 (안전한 문자만 유지)"""
-    import re
-    
     # 기본 정리
     sanitized = filename.strip()
     
     # 안전하지 않은 문자 제거
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', sanitized)
+    sanitized = sanitized.translate(_SANITIZE_TABLE)
     
-    # 연속된 공백을 하나로
-    sanitized = re.sub(r'\s+', ' ', sanitized)
-    
-    # 연속된 언더스코어를 하나로
-    sanitized = re.sub(r'_+', '_', sanitized)
+    # 연속된 공백은 공백 하나로, 연속된 언더스코어는 언더스코어 하나로 (한 번에 처리)
+    sanitized = _COLLAPSE_RE.sub(_collapse_run, sanitized)
     
     # 앞뒤 점과 공백 제거
     sanitized = sanitized.strip('. ')
@@ -328,31 +411,20 @@ def sanitize_filename(filename: str) -> str:
 
 def extract_chapter_info(filename: str) -> Dict[str, Any]:
     """파일명에서 챕터 정보 추출"""
-    import re
-    
     sanitized_name = sanitize_filename(filename)
     name_without_ext = sanitized_name.rsplit('.', 1)[0]
     
-    # 챕터 번호 패턴 매칭
-    chapter_patterns = [
-        (r'(\d+)_(\d+)', lambda m: int(m.group(2))),  # "1_1" → 1
-        (r'chapter\s*(\d+)', lambda m: int(m.group(1))),  # "Chapter 1" → 1
-        (r'(\d+)장', lambda m: int(m.group(1))),  # "1장" → 1
-        (r'(\d+)편', lambda m: int(m.group(1))),  # "1편" → 1
-        (r'(\d+)회', lambda m: int(m.group(1))),  # "1회" → 1
-        (r'^(\d+)', lambda m: int(m.group(1))),  # 시작 숫자 → 숫자
-    ]
-    
     chapter_number = None
     suggested_title = name_without_ext
     
-    for pattern, extractor in chapter_patterns:
-        match = re.search(pattern, name_without_ext, re.IGNORECASE)
+    # 챕터 번호 패턴 매칭
+    for pattern, extractor in _CHAPTER_PATTERNS:
+        match = pattern.search(name_without_ext)
         if match:
             try:
                 chapter_number = extractor(match)
                 # 패턴 부분을 제거하여 제목 추출
-                suggested_title = re.sub(pattern, '', name_without_ext, flags=re.IGNORECASE).strip()
+                suggested_title = pattern.sub('', name_without_ext).strip()
                 break
             except (ValueError, IndexError):
                 continue
@@ -151,6 +151,14 @@ export function useWebSocketLogs({
         })
         break
 
+      case 'log_batch':
+        // 묶음 로그 메시지
+        setLogs(prev => {
+          const newLogs = [...prev, ...(data.data as LogMessage[])]
+          return newLogs.slice(-maxLogHistory)
+        })
+        break
+
       case 'history':
         // 로그 히스토리
         setLogs(data.logs as LogMessage[])
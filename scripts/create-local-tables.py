@@ -4,11 +4,18 @@ DynamoDB Local 테이블 생성 스크립트
 
 설계 문서의 데이터 모델을 기반으로 로컬 개발용 DynamoDB 테이블을 생성합니다.
 PynamoDB 모델 정의(Book, AudioChapter)를 직접 사용하여 테이블을 생성합니다.
+(GSI 등 스키마는 모델 Meta/인덱스 정의를 그대로 따릅니다.)
+
+사용법:
+    python scripts/create-local-tables.py          # 테이블만 생성
+    python scripts/create-local-tables.py --seed   # 테이블 생성 + 샘플 데이터
 """
 
+import argparse
 import boto3
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from botocore.exceptions import ClientError, EndpointConnectionError
 
@@ -24,13 +31,14 @@ from app.models.audio_chapter import AudioChapter, FileInfo  # type: ignore
 
 
 def create_dynamodb_client():
-    """DynamoDB Local 클라이언트 생성"""
+    """DynamoDB Local 클라이언트 생성 (테이블을 만드는 모델과 같은 엔드포인트/리전 사용)"""
+    meta = Book.Meta
     return boto3.client(
         'dynamodb',
-        endpoint_url='http://localhost:8001',
-        region_name='ap-northeast-2',
-        aws_access_key_id='local',
-        aws_secret_access_key='local'
+        endpoint_url=getattr(meta, 'host', None) or settings.DYNAMODB_ENDPOINT_URL,
+        region_name=getattr(meta, 'region', None) or settings.AWS_REGION,
+        aws_access_key_id=getattr(meta, 'aws_access_key_id', None) or 'local',
+        aws_secret_access_key=getattr(meta, 'aws_secret_access_key', None) or 'local'
     )
 
 
@@ -38,9 +46,11 @@ def wait_for_dynamodb():
     """DynamoDB Local이 준비될 때까지 대기"""
     print("🔄 DynamoDB Local 연결 대기 중...")
     
+    # 연결 오류는 요청 단위이므로 클라이언트는 한 번만 생성하여 재사용
+    client = create_dynamodb_client()
+    
     for attempt in range(30):  # 최대 30초 대기
         try:
-            client = create_dynamodb_client()
             client.list_tables()
             print("✅ DynamoDB Local 연결 성공")
             return client
@@ -56,37 +66,82 @@ def wait_for_dynamodb():
             sys.exit(1)
 
 
+def _request_table_creation(model):
+    """테이블이 없으면 생성 요청 (생성 요청했으면 True, 이미 있으면 False)"""
+    table_name = model.Meta.table_name
+    if model.exists():
+        print(f"ℹ️  {table_name} 이미 존재")
+        return False
+    print(f"🛠️  PynamoDB로 테이블 생성: {table_name}")
+    model.create_table(read_capacity_units=5, write_capacity_units=5, wait=False)
+    return True
+
+
 def create_tables_with_pynamodb():
-    """PynamoDB 모델을 사용하여 테이블 생성"""
-    created = 0
+    """PynamoDB 모델을 사용하여 테이블 생성 (모델별 확인/생성 요청을 병렬로 보낸 뒤 한 번에 대기)"""
+    created = []
     exists = 0
+    failed = False
     models = [Book, AudioChapter]
 
-    for model in models:
-        try:
-            table_name = model.Meta.table_name
-            if not model.exists():
-                print(f"🛠️  PynamoDB로 테이블 생성: {table_name}")
-                model.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
-                print(f"🎉 {table_name} 생성 완료")
-                created += 1
-            else:
-                print(f"ℹ️  {table_name} 이미 존재")
-                exists += 1
-        except Exception as e:
-            print(f"❌ {model.__name__} 테이블 생성 실패: {e}")
-            return False
+    with ThreadPoolExecutor(max_workers=len(models)) as executor:
+        futures = {executor.submit(_request_table_creation, model): model for model in models}
+        for future in as_completed(futures):
+            model = futures[future]
+            try:
+                if future.result():
+                    created.append(model)
+                else:
+                    exists += 1
+            except Exception as e:
+                print(f"❌ {model.__name__} 테이블 생성 실패: {e}")
+                failed = True
+
+    if failed:
+        return False
+
+    if created and not wait_for_tables_active(created):
+        return False
 
     # 모든 모델이 생성되었거나 이미 존재하면 성공으로 간주
-    return (created + exists) == len(models)
+    return (len(created) + exists) == len(models)
+
+
+def wait_for_tables_active(models, timeout=60.0, interval=0.2):
+    """생성 요청한 테이블들이 모두 ACTIVE가 될 때까지 함께 폴링"""
+    pending = list(models)
+    deadline = time.monotonic() + timeout
+
+    while pending:
+        still_pending = []
+        for model in pending:
+            try:
+                status = model.describe_table().get('TableStatus')
+            except Exception as e:
+                print(f"❌ {model.Meta.table_name} 상태 확인 실패: {e}")
+                return False
+            if status == 'ACTIVE':
+                print(f"🎉 {model.Meta.table_name} 생성 완료")
+            else:
+                still_pending.append(model)
+        pending = still_pending
+
+        if pending:
+            if time.monotonic() >= deadline:
+                names = ", ".join(model.Meta.table_name for model in pending)
+                print(f"❌ 테이블 활성화 대기 시간 초과: {names}")
+                return False
+            time.sleep(interval)
+
+    return True
 
 
-def create_sample_data_with_models():
-    """샘플 데이터 생성 (PynamoDB 모델 사용)"""
+def create_sample_data_with_models(client):
+    """샘플 데이터 생성 (PynamoDB 모델 사용, 두 테이블을 한 번의 BatchWriteItem으로 저장)"""
     print("📝 샘플 데이터 생성 중(PynamoDB 모델 기반)...")
 
-    # 샘플 Book
     try:
+        # 샘플 Book
         book = Book(
             user_id="test_user",
             book_id="sample-book-001",
@@ -94,7 +149,6 @@ def create_sample_data_with_models():
             author="테스트 작가",
             publisher="테스트 출판사",
         )
-        book.save()
 
         # 샘플 AudioChapter
         chapter = AudioChapter(
@@ -110,7 +164,12 @@ def create_sample_data_with_models():
             ),
             status="ready",
         )
-        chapter.save()
+
+        request_items = {
+            model.Meta.table_name: [{'PutRequest': {'Item': model.serialize()}}]
+            for model in (book, chapter)
+        }
+        batch_write_with_retry(client, request_items)
 
         print("✅ 샘플 데이터 생성 완료")
         return True
@@ -119,13 +178,18 @@ def create_sample_data_with_models():
         return False
 
 
-def create_sample_data_legacy(client):
-    """(레거시) boto3로 샘플 데이터 생성 - 유지용"""
-    try:
-        client.list_tables()
-    except Exception:
-        return False
-    return True
+def batch_write_with_retry(client, request_items, max_attempts=5):
+    """BatchWriteItem 실행 (UnprocessedItems는 지수 백오프로 재시도)"""
+    delay = 0.1
+    for attempt in range(max_attempts):
+        response = client.batch_write_item(RequestItems=request_items)
+        request_items = response.get('UnprocessedItems') or {}
+        if not request_items:
+            return
+        if attempt < max_attempts - 1:
+            time.sleep(delay)
+            delay *= 2
+    raise RuntimeError(f"처리되지 않은 항목이 남아 있습니다: {list(request_items)}")
 
 
 def list_tables(client):
@@ -145,8 +209,21 @@ def list_tables(client):
         return False
 
 
-def main():
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="DynamoDB Local 테이블 생성")
+    parser.add_argument(
+        "--seed",
+        action="store_true",
+        help="테이블 생성 후 샘플 데이터도 함께 생성",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """메인 함수"""
+    args = parse_args(argv)
+    
     print("🚀 DynamoDB Local 테이블 생성 시작...")
     print("=" * 50)
     
@@ -156,8 +233,9 @@ def main():
     # 테이블 생성(PynamoDB)
     created_ok = create_tables_with_pynamodb()
     
-    # 샘플 데이터 생성(PynamoDB)
-    create_sample_data_with_models()
+    # 샘플 데이터 생성(PynamoDB, --seed 지정 시에만)
+    if args.seed:
+        create_sample_data_with_models(client)
     
     # 결과 출력
     print("\n" + "=" * 50)
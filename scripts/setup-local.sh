@@ -142,7 +142,7 @@ if [ -f "docker-compose.yml" ]; then
     # 7. DynamoDB 테이블 생성
     if [ -f "scripts/create-local-tables.py" ]; then
         echo -e "${BLUE}🏗️  DynamoDB 테이블 생성 중...${NC}"
-        poetry run python scripts/create-local-tables.py
+        poetry run python scripts/create-local-tables.py --seed
         success_msg "DynamoDB 테이블 생성 완료"
     else
         warning_msg "scripts/create-local-tables.py 파일이 없습니다"
@@ -46,7 +46,7 @@ done
 # 4) Create local tables and sample data
 echo "[start-local] Creating local tables..."
 pushd "$ROOT_DIR" >/dev/null
-poetry run python scripts/create-local-tables.py || true
+poetry run python scripts/create-local-tables.py --seed || true
 popd >/dev/null
 
 # 5) Start backend (FastAPI) on :8000
@@ -0,0 +1,72 @@
+"""
+공용 테스트 픽스처
+DynamoDB 테이블 확인과 TestClient 생성을 세션당 한 번만 수행
+"""
+import sys
+import os
+import pytest
+
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BACKEND_DIR = os.path.join(PROJECT_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+
+@pytest.fixture(scope="session")
+def local_env():
+    """로컬 바이패스 환경 설정 (세션당 한 번 적용, 종료 시 원래 값 복원)"""
+    from app.core.config import settings
+
+    original = (settings.ENVIRONMENT, settings.LOCAL_BYPASS_ENABLED, settings.LOCAL_BYPASS_SCOPE)
+    settings.ENVIRONMENT = "local"
+    settings.LOCAL_BYPASS_ENABLED = True
+    settings.LOCAL_BYPASS_SCOPE = "admin"
+    yield
+    settings.ENVIRONMENT, settings.LOCAL_BYPASS_ENABLED, settings.LOCAL_BYPASS_SCOPE = original
+
+
+@pytest.fixture(autouse=True)
+def _restore_bypass_settings():
+    """테스트가 바꾼 바이패스 설정을 테스트마다 원래 값으로 복원 (실행 순서 의존 방지)"""
+    from app.core.config import settings
+
+    original = (settings.ENVIRONMENT, settings.LOCAL_BYPASS_ENABLED, settings.LOCAL_BYPASS_SCOPE)
+    yield
+    settings.ENVIRONMENT, settings.LOCAL_BYPASS_ENABLED, settings.LOCAL_BYPASS_SCOPE = original
+
+
+# 테이블 확인/생성 완료 여부 (프로세스당 DescribeTable 확인은 한 번만)
+_TABLES_READY = False
+
+
+def _ensure_tables_once():
+    """Book/AudioChapter 테이블이 없으면 생성 (이미 확인했으면 바로 반환)"""
+    global _TABLES_READY
+    if _TABLES_READY:
+        return
+
+    from app.models.book import Book
+    from app.models.audio_chapter import AudioChapter
+
+    if not Book.exists():
+        Book.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
+    if not AudioChapter.exists():
+        AudioChapter.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
+    _TABLES_READY = True
+
+
+@pytest.fixture(scope="session")
+def dynamodb_tables():
+    """DynamoDB 테이블 준비 (DynamoDB가 필요한 모듈에서만 사용)"""
+    _ensure_tables_once()
+    yield
+
+
+@pytest.fixture(scope="session")
+def client():
+    """세션 전체에서 공유하는 TestClient"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    return TestClient(app)
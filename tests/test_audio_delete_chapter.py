@@ -2,7 +2,6 @@ import sys
 import os
 import uuid
 import pytest
-from fastapi.testclient import TestClient
 
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -10,37 +9,20 @@ BACKEND_DIR = os.path.join(PROJECT_ROOT, "backend")
 if BACKEND_DIR not in sys.path:
     sys.path.insert(0, BACKEND_DIR)
 
-from app.main import app  # noqa: E402
 from app.core.config import settings  # noqa: E402
 from app.services.books import BookService  # noqa: E402
 from app.models.audio_chapter import AudioChapter, FileInfo, AudioMetadata  # noqa: E402
 
 
-@pytest.fixture(autouse=True)
-def _local_setup(tmp_path):
-    settings.ENVIRONMENT = "local"
-    settings.LOCAL_BYPASS_ENABLED = True
-    yield
+pytestmark = pytest.mark.usefixtures("local_env", "dynamodb_tables")
 
 
-def _ensure_tables():
-    from app.models.book import Book
-    if not Book.exists():
-        Book.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
-    if not AudioChapter.exists():
-        AudioChapter.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
-
-
-def test_delete_chapter_success():
-    _ensure_tables()
-    client = TestClient(app)
+def test_delete_chapter_success(client, tmp_path):
     book = BookService.create_book(user_id=settings.LOCAL_BYPASS_SUB, title="B", author="A")
     # local file path for deletion simulation
-    local_dir = tmp_path = os.path.join(os.getcwd(), "tmp_test_media")
-    os.makedirs(local_dir, exist_ok=True)
-    local_path = os.path.join(local_dir, "001.m4a")
-    with open(local_path, "wb") as f:
-        f.write(b"\x00")
+    local_file = tmp_path / "001.m4a"
+    local_file.write_bytes(b"\x00")
+    local_path = str(local_file)
 
     c = AudioChapter(
         chapter_id=str(uuid.uuid4()),
@@ -3,7 +3,6 @@ import os
 import uuid
 import io
 import pytest
-from fastapi.testclient import TestClient
 
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -11,31 +10,15 @@ BACKEND_DIR = os.path.join(PROJECT_ROOT, "backend")
 if BACKEND_DIR not in sys.path:
     sys.path.insert(0, BACKEND_DIR)
 
-from app.main import app  # noqa: E402
 from app.core.config import settings  # noqa: E402
 from app.services.books import BookService  # noqa: E402
 from app.models.audio_chapter import AudioChapter, FileInfo, AudioMetadata  # noqa: E402
 
 
-@pytest.fixture(autouse=True)
-def _local_setup():
-    settings.ENVIRONMENT = "local"
-    settings.LOCAL_BYPASS_ENABLED = True
-    settings.LOCAL_BYPASS_SCOPE = "admin"
-    yield
+pytestmark = pytest.mark.usefixtures("local_env", "dynamodb_tables")
 
 
-def _ensure_tables():
-    from app.models.book import Book
-    if not Book.exists():
-        Book.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
-    if not AudioChapter.exists():
-        AudioChapter.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
-
-
-def test_audio_upload_list_reorder_delete_flow():
-    _ensure_tables()
-    client = TestClient(app)
+def test_audio_upload_list_reorder_delete_flow(client):
 
     # 1) Book 생성 (로컬 바이패스 사용자)
     book = BookService.create_book(user_id=settings.LOCAL_BYPASS_SUB, title="B", author="A")
@@ -0,0 +1,128 @@
+"""
+헤더 기반 오디오 메타데이터 추출 테스트
+"""
+import sys
+import os
+import struct
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BACKEND_DIR = os.path.join(PROJECT_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from app.utils.audio_metadata import extract_audio_metadata
+
+
+def _wav_header(channels: int = 1, sample_rate: int = 44100, bits: int = 16) -> bytes:
+    byte_rate = sample_rate * channels * bits // 8
+    block_align = channels * bits // 8
+    return (
+        b"RIFF" + struct.pack("<I", 36) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, 1, channels, sample_rate, byte_rate, block_align, bits)
+        + b"data" + struct.pack("<I", 0)
+    )
+
+
+def _wav_with_leading_chunk(chunk_id: bytes, payload: bytes, **kwargs) -> bytes:
+    """fmt 청크 앞에 다른 청크(JUNK, bext 등)가 있는 WAV"""
+    wav = _wav_header(**kwargs)
+    padding = b"\x00" if len(payload) % 2 else b""
+    return wav[:12] + chunk_id + struct.pack("<I", len(payload)) + payload + padding + wav[12:]
+
+
+class TestExtractAudioMetadata:
+    """오디오 메타데이터 추출 테스트"""
+
+    def test_wav_header_fields(self, tmp_path):
+        """WAV 헤더에서 채널/샘플레이트/비트레이트 추출"""
+        path = tmp_path / "chapter.wav"
+        path.write_bytes(_wav_header(channels=2, sample_rate=48000))
+
+        metadata = extract_audio_metadata(str(path))
+
+        assert metadata["format"] == "wav"
+        assert metadata["channels"] == 2
+        assert metadata["sample_rate"] == 48000
+        assert metadata["bitrate"] == 1536
+        assert metadata["duration"] is None
+
+    def test_wav_with_chunks_before_fmt(self, tmp_path):
+        """JUNK/bext 청크가 fmt 앞에 있어도 fmt 청크 값을 읽음"""
+        path = tmp_path / "chapter.wav"
+        path.write_bytes(_wav_with_leading_chunk(b"JUNK", b"\x00" * 28, channels=2, sample_rate=48000))
+
+        metadata = extract_audio_metadata(str(path))
+
+        assert metadata["channels"] == 2
+        assert metadata["sample_rate"] == 48000
+        assert metadata["bitrate"] == 1536
+
+        path = tmp_path / "bwf.wav"
+        path.write_bytes(_wav_with_leading_chunk(b"bext", b"\x01" * 603, channels=1, sample_rate=22050))
+
+        metadata = extract_audio_metadata(str(path))
+
+        assert metadata["channels"] == 1
+        assert metadata["sample_rate"] == 22050
+
+    def test_wav_without_fmt_chunk(self, tmp_path):
+        """data 청크 전에 fmt 청크가 없으면 헤더 값을 쓰지 않음"""
+        path = tmp_path / "chapter.wav"
+        path.write_bytes(b"RIFF" + struct.pack("<I", 12) + b"WAVE" + b"data" + struct.pack("<I", 4) + b"\x01" * 4)
+
+        metadata = extract_audio_metadata(str(path))
+
+        assert metadata["format"] == "wav"
+        assert metadata["channels"] is None
+        assert metadata["sample_rate"] is None
+        assert metadata["bitrate"] is None
+
+    def test_non_wav_falls_back_to_extension(self, tmp_path):
+        """WAV가 아닌 파일은 확장자 기반 정보만 반환"""
+        path = tmp_path / "chapter.mp3"
+        path.write_bytes(b"\xFF\xFB" + b"\x00" * 100)
+
+        metadata = extract_audio_metadata(str(path))
+
+        assert metadata["format"] == "mp3"
+        assert metadata["channels"] is None
+        assert metadata["sample_rate"] is None
+
+    def test_mp4_brand_overrides_wrong_extension(self, tmp_path):
+        """ftyp 박스가 있으면 확장자와 무관하게 mp4 컨테이너로 인식"""
+        path = tmp_path / "chapter.bin"
+        path.write_bytes(b"\x00\x00\x00\x20ftypisom" + b"\x00" * 100)
+
+        metadata = extract_audio_metadata(str(path))
+
+        assert metadata["format"] == "mp4"
+
+    def test_m4a_brand_keeps_extension(self, tmp_path):
+        """m4a 확장자와 M4A brand가 일치하면 확장자를 유지"""
+        path = tmp_path / "chapter.m4a"
+        path.write_bytes(b"\x00\x00\x00\x1cftypM4A " + b"\x00" * 100)
+
+        metadata = extract_audio_metadata(str(path))
+
+        assert metadata["format"] == "m4a"
+        assert metadata["channels"] is None
+
+    def test_rewritten_file_is_reread(self, tmp_path):
+        """같은 경로라도 파일이 바뀌면 캐시된 헤더 정보를 재사용하지 않음"""
+        path = tmp_path / "chapter.wav"
+        path.write_bytes(_wav_header(channels=1, sample_rate=22050))
+        assert extract_audio_metadata(str(path))["channels"] == 1
+
+        path.write_bytes(_wav_header(channels=2, sample_rate=48000) + b"\x00" * 4)
+
+        metadata = extract_audio_metadata(str(path))
+
+        assert metadata["channels"] == 2
+        assert metadata["sample_rate"] == 48000
+
+    def test_missing_file(self):
+        """존재하지 않는 파일도 예외 없이 처리"""
+        metadata = extract_audio_metadata("/nonexistent/chapter.m4a")
+
+        assert metadata["format"] == "m4a"
+        assert metadata["bitrate"] is None
@@ -2,7 +2,6 @@ import sys
 import os
 import uuid
 import pytest
-from fastapi.testclient import TestClient
 
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -10,30 +9,15 @@ BACKEND_DIR = os.path.join(PROJECT_ROOT, "backend")
 if BACKEND_DIR not in sys.path:
     sys.path.insert(0, BACKEND_DIR)
 
-from app.main import app  # noqa: E402
 from app.core.config import settings  # noqa: E402
 from app.services.books import BookService  # noqa: E402
 from app.models.audio_chapter import AudioChapter, FileInfo, AudioMetadata  # noqa: E402
 
 
-@pytest.fixture(autouse=True)
-def _local_setup():
-    settings.ENVIRONMENT = "local"
-    settings.LOCAL_BYPASS_ENABLED = True
-    yield
+pytestmark = pytest.mark.usefixtures("local_env", "dynamodb_tables")
 
 
-def _ensure_tables():
-    from app.models.book import Book
-    if not Book.exists():
-        Book.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
-    if not AudioChapter.exists():
-        AudioChapter.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
-
-
-def test_reorder_chapter_success():
-    _ensure_tables()
-    client = TestClient(app)
+def test_reorder_chapter_success(client):
     book = BookService.create_book(user_id=settings.LOCAL_BYPASS_SUB, title="B", author="A")
     c = AudioChapter(
         chapter_id=str(uuid.uuid4()),
@@ -51,9 +35,7 @@ def test_reorder_chapter_success():
     assert r.json()["chapter_number"] == 3
 
 
-def test_reorder_chapter_for_not_owned_book_returns_404():
-    _ensure_tables()
-    client = TestClient(app)
+def test_reorder_chapter_for_not_owned_book_returns_404(client):
     # another user's book
     other_book = BookService.create_book(user_id="someone", title="B", author="A")
     c = AudioChapter(
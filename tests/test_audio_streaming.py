@@ -14,49 +14,62 @@ if BACKEND_DIR not in sys.path:
 from app.main import app
 from app.core.config import settings
 from app.services.books import BookService
-from app.models.book import Book
 from app.models.audio_chapter import AudioChapter
 
 # 테스트 오디오 파일 경로
-TEST_AUDIO_DIR = "/Users/kimsungwook/dev/voj/tmp_test_media/sample_audiobooks"
+TEST_AUDIO_DIR = os.environ.get(
+    "VOJ_TEST_AUDIO_DIR",
+    os.path.join(PROJECT_ROOT, "tmp_test_media", "sample_audiobooks")
+)
 
+pytestmark = pytest.mark.usefixtures("local_env", "dynamodb_tables")
 
-@pytest.fixture(autouse=True)
-def _local_setup():
-    """로컬 환경 설정"""
-    settings.ENVIRONMENT = "local"
-    settings.LOCAL_BYPASS_ENABLED = True
-    settings.LOCAL_BYPASS_SCOPE = "admin"
-    
-    # 테이블 생성
-    if not Book.exists():
-        Book.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
-    if not AudioChapter.exists():
-        AudioChapter.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
+
+@pytest.fixture
+def seeded():
+    """테스트 중 생성한 레코드 목록 (종료 시 키로 직접 삭제)"""
+    items = []
+    yield items
     
-    yield
+    # 챕터를 먼저 지우도록 생성 역순으로 삭제
+    for item in reversed(items):
+        try:
+            item.delete()
+        except Exception:
+            pass
 
 
 class TestAudioStreaming:
     """오디오 스트리밍 테스트"""
     
-    def setup_method(self):
-        """각 테스트 전 설정"""
-        self.client = TestClient(app)
-        
-        # 테스트용 책 생성
-        self.book = BookService.create_book(
+    @classmethod
+    def setup_class(cls):
+        """클래스 단위 설정 (클라이언트와 테스트용 책은 한 번만 생성)"""
+        cls.client = TestClient(app)
+        cls.book = BookService.create_book(
             user_id=settings.LOCAL_BYPASS_SUB,
             title="Streaming Test Book",
             author="Test Author"
         )
+    
+    @classmethod
+    def teardown_class(cls):
+        """테스트용 책 삭제"""
+        try:
+            cls.book.delete()
+        except Exception:
+            pass
+    
+    @pytest.fixture(autouse=True)
+    def _track_seeded(self, seeded):
+        """테스트별로 생성한 레코드 등록용"""
+        self.seeded = seeded
 
-    @pytest.mark.skipif(
-        not os.path.exists(TEST_AUDIO_DIR) or not os.listdir(TEST_AUDIO_DIR),
-        reason="실제 오디오 파일이 없음"
-    )
     def test_upload_and_stream_real_audio(self):
         """실제 오디오 파일 업로드 및 스트리밍 테스트"""
+        if not os.path.isdir(TEST_AUDIO_DIR):
+            pytest.skip("실제 오디오 파일이 없음")
+        
         mp3_files = [f for f in os.listdir(TEST_AUDIO_DIR) if f.endswith('.m4a')]
         
         if not mp3_files:
@@ -79,6 +92,10 @@ class TestAudioStreaming:
         upload_data = upload_response.json()
         chapter_id = upload_data["chapter_id"]
         
+        chapter = AudioChapter.get_by_id(chapter_id)
+        if chapter:
+            self.seeded.append(chapter)
+        
         print(f"Chapter created: {chapter_id}")
         
         # 2. 스트리밍 URL 생성
@@ -138,6 +155,7 @@ class TestAudioStreaming:
             title="Other User Book",
             author="Other Author"
         )
+        self.seeded.append(other_book)
         
         response = self.client.get(
             f"/api/v1/audio/{other_book.book_id}/chapters/any-chapter/stream"
@@ -164,6 +182,7 @@ class TestAudioStreaming:
             )
         )
         chapter.save()
+        self.seeded.append(chapter)
         
         # 스트리밍 URL 요청 (파일이 없어서 실패할 것)
         response = self.client.get(
@@ -173,22 +192,3 @@ class TestAudioStreaming:
         # 파일이 없어서 404가 나와야 함
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
-
-
-@pytest.fixture(autouse=True)
-def cleanup_test_data():
-    """테스트 데이터 정리"""
-    yield
-    
-    try:
-        # 테스트 책 삭제
-        for book in Book.scan():
-            if "Streaming Test" in book.title or "Other User" in book.title:
-                book.delete()
-        
-        # 테스트 챕터 삭제
-        for chapter in AudioChapter.scan():
-            if "Streaming Test" in chapter.title or "test-streaming" in chapter.chapter_id:
-                chapter.delete()
-    except Exception:
-        pass
@@ -18,22 +18,17 @@ from app.services.storage import factory as storage_factory  # noqa: E402
 from app.core.auth import simple as auth_simple  # noqa: E402
 
 
-@pytest.fixture(autouse=True)
-def _prod_setup():
-    settings.ENVIRONMENT = "production"
-    yield
+pytestmark = pytest.mark.usefixtures("dynamodb_tables")
 
 
-def _ensure_tables():
-    from app.models.book import Book
-    if not Book.exists():
-        Book.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
-    if not AudioChapter.exists():
-        AudioChapter.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
+@pytest.fixture(autouse=True)
+def _prod_setup(monkeypatch):
+    # 세션 단위 로컬 설정을 덮어쓰므로 테스트 후 원래 값으로 복원
+    monkeypatch.setattr(settings, "ENVIRONMENT", "production")
+    yield
 
 
 def test_streaming_uses_cloudfront_signed_url(monkeypatch):
-    _ensure_tables()
     client = TestClient(app)
 
     # override auth to return a fixed user
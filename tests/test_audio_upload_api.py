@@ -19,6 +19,8 @@ from app.services.books import BookService
 from app.models.book import Book
 from app.models.audio_chapter import AudioChapter
 
+pytestmark = pytest.mark.usefixtures("dynamodb_tables")
+
 
 @pytest.fixture(autouse=True)
 def _local_setup():
@@ -26,13 +28,6 @@ def _local_setup():
     settings.ENVIRONMENT = "local"
     settings.LOCAL_BYPASS_ENABLED = True
     settings.LOCAL_BYPASS_SCOPE = "admin"
-    
-    # 테이블 생성
-    if not Book.exists():
-        Book.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
-    if not AudioChapter.exists():
-        AudioChapter.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
-    
     yield
 
 
@@ -80,6 +80,29 @@ class TestAudioFileValidator:
         assert not result.is_valid
         assert any("시그니처" in error for error in result.errors)
     
+    def test_validate_header_only_with_total_size(self):
+        """앞부분만 전달하고 전체 크기를 지정한 경우 크기 검증은 total_size 기준"""
+        header = b'\xFF\xFB' + b'\x00' * (AudioFileValidator.HEADER_READ_SIZE - 2)
+        
+        ok_result = self.validator.validate_file_basic(header, "test.mp3", "audio/mpeg", total_size=50 * 1024 * 1024)
+        large_result = self.validator.validate_file_basic(header, "test.mp3", "audio/mpeg", total_size=101 * 1024 * 1024)
+        
+        assert ok_result.is_valid
+        assert not large_result.is_valid
+        assert any("크기 초과" in error for error in large_result.errors)
+    
+    def test_validate_file_signature_id3_beyond_header(self):
+        """ID3 태그가 헤더보다 길면 앞부분만으로 MP3로 판단"""
+        tag_size = 100000  # 앨범 아트 등으로 큰 ID3 태그
+        size_bytes = bytes([(tag_size >> 21) & 0x7F, (tag_size >> 14) & 0x7F, (tag_size >> 7) & 0x7F, tag_size & 0x7F])
+        header = b'ID3\x03\x00\x00' + size_bytes + b'\x00' * 4086
+        
+        truncated_result = self.validator.validate_file_signature(header, total_size=5 * 1024 * 1024)
+        full_result = self.validator.validate_file_signature(header)
+        
+        assert truncated_result.is_valid
+        assert not full_result.is_valid
+    
     def test_validate_audio_metadata_success(self):
         """오디오 메타데이터 검증 성공 테스트"""
         metadata = {
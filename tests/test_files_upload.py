@@ -60,10 +60,10 @@ def test_upload_rejects_unsupported_type():
     assert resp.status_code == 400
 
 
-def test_upload_forbidden_without_required_scope():
+def test_upload_forbidden_without_required_scope(monkeypatch):
     client = TestClient(app)
-    # Drop admin/editor scope
-    settings.LOCAL_BYPASS_SCOPE = "viewer"
+    # Drop admin/editor scope (restored after the test)
+    monkeypatch.setattr(settings, "LOCAL_BYPASS_SCOPE", "viewer")
     files = {
         "file": ("001.m4a", b"\x00" * 100, "audio/mp4"),
     }
@@ -0,0 +1,220 @@
+"""
+WebSocket 로그 스트리머 테스트
+"""
+import sys
+import os
+import json
+import asyncio
+import pytest
+import pytest_asyncio
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BACKEND_DIR = os.path.join(PROJECT_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from app.services.websocket import log_streamer as ls  # noqa: E402
+from app.services.websocket.log_streamer import (  # noqa: E402
+    WebSocketLogStreamer,
+    LogLevel,
+    LogCategory,
+)
+
+
+class FakeWebSocket:
+    """전송된 프레임을 기록하는 가짜 WebSocket"""
+
+    def __init__(self):
+        self.sent = []
+        self.closed_code = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
+    async def close(self, code=1000):
+        self.closed_code = code
+
+
+async def _drain():
+    """연결별 전송 태스크가 대기열을 비울 때까지 양보"""
+    for _ in range(5):
+        await asyncio.sleep(0.001)
+
+
+@pytest_asyncio.fixture
+async def streamer():
+    """테스트 종료 시 남은 연결(전송 태스크)을 모두 정리하는 스트리머"""
+    instance = WebSocketLogStreamer()
+    yield instance
+    for connection_id in list(instance.connections):
+        await instance.disconnect(connection_id)
+    await _drain()
+
+
+async def _connect(streamer, connection_id):
+    ws = FakeWebSocket()
+    await streamer.connect(ws, connection_id)
+    await _drain()
+    ws.sent.clear()
+    return ws
+
+
+@pytest.mark.asyncio
+async def test_unserializable_log_does_not_drop_others(streamer):
+    """직렬화할 수 없는 details가 있는 로그만 건너뛰고 같은 묶음의 다른 로그는 전송"""
+    ws = await _connect(streamer, "c1")
+
+    streamer.add_log(LogLevel.INFO, LogCategory.SYSTEM, "bad", details={"tags": {1, 2}})
+    streamer.add_log(LogLevel.INFO, LogCategory.SYSTEM, "after")
+    await asyncio.sleep(ls._FLUSH_INTERVAL * 3)
+    await _drain()
+
+    assert [frame["type"] for frame in ws.sent] == ["log"]
+    assert ws.sent[0]["data"]["message"] == "after"
+    assert [log.message for log in streamer.log_history] == ["after"]
+
+
+class BlockedWebSocket(FakeWebSocket):
+    """send_text가 끝나지 않는 (느린 소비자) WebSocket"""
+
+    async def send_text(self, text):
+        await asyncio.Event().wait()
+
+
+async def _connect_blocked(streamer, connection_id):
+    ws = BlockedWebSocket()
+    await streamer.connect(ws, connection_id)
+    await _drain()
+    return ws
+
+
+@pytest.mark.asyncio
+async def test_full_queue_closes_slow_connection(streamer):
+    """전송 대기열이 가득 차면 연결 정리와 함께 소켓을 1013으로 닫음"""
+    ws = await _connect_blocked(streamer, "slow")
+    outbox = streamer._outboxes["slow"]
+
+    results = [
+        await streamer.send_to_connection("slow", {"type": "ping", "n": i})
+        for i in range(ls._OUTBOX_SIZE + 5)
+    ]
+    await _drain()
+
+    assert results[-1] is False
+    assert ws.closed_code == 1013
+    assert outbox.empty()
+    assert "slow" not in streamer.connections
+    assert "slow" not in streamer._outboxes
+    assert "slow" not in streamer._global_subs
+
+
+@pytest.mark.asyncio
+async def test_send_timeout_closes_connection(streamer, monkeypatch):
+    """전송 제한 시간을 넘기면 소켓을 닫아 클라이언트가 재연결하도록 함"""
+    monkeypatch.setattr(ls, "_SEND_TIMEOUT", 0.05)
+    ws = await _connect_blocked(streamer, "stuck")
+
+    await asyncio.sleep(0.2)
+    await _drain()
+
+    assert ws.closed_code == 1013
+    assert "stuck" not in streamer.connections
+    assert "stuck" not in streamer._sender_tasks
+
+
+def _log(message, chapter_id=None):
+    return ls.LogMessage(
+        id=message,
+        timestamp=ls.datetime.now(ls.timezone.utc),
+        level=LogLevel.INFO,
+        category=LogCategory.SYSTEM,
+        message=message,
+        chapter_id=chapter_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_subscription_index_upkeep(streamer):
+    """구독/해제/연결 해제 시 챕터 역인덱스와 전체 구독 집합 갱신"""
+    await _connect(streamer, "c1")
+    await _connect(streamer, "c2")
+    assert streamer._global_subs == {"c1", "c2"}
+
+    await streamer.subscribe_to_chapter("c1", "ch1")
+    await streamer.subscribe_to_chapter("c1", "ch2")
+    await streamer.subscribe_to_chapter("c2", "ch1")
+    assert streamer._chapter_index == {"ch1": {"c1", "c2"}, "ch2": {"c1"}}
+    assert streamer._global_subs == set()
+
+    await streamer.unsubscribe_from_chapter("c1", "ch2")
+    assert streamer._chapter_index == {"ch1": {"c1", "c2"}}
+    assert "c1" not in streamer._global_subs
+
+    # 마지막 챕터 구독을 해제하면 다시 전체 로그 구독
+    await streamer.unsubscribe_from_chapter("c2", "ch1")
+    assert streamer._chapter_index == {"ch1": {"c1"}}
+    assert streamer._global_subs == {"c2"}
+
+    await streamer.disconnect("c1")
+    assert streamer._chapter_index == {}
+    assert "c1" not in streamer.subscriptions
+
+    await streamer.disconnect("c2")
+    assert streamer._global_subs == set()
+
+
+@pytest.mark.asyncio
+async def test_chapter_and_global_fan_out(streamer):
+    """전체 구독 연결은 모든 로그, 챕터 구독 연결은 해당 챕터 로그만 수신"""
+    ws_all = await _connect(streamer, "all")
+    ws_ch1 = await _connect(streamer, "ch1-only")
+    ws_ch2 = await _connect(streamer, "ch2-only")
+    await streamer.subscribe_to_chapter("ch1-only", "ch1")
+    await streamer.subscribe_to_chapter("ch2-only", "ch2")
+    await _drain()
+    for ws in (ws_all, ws_ch1, ws_ch2):
+        ws.sent.clear()
+
+    await streamer.broadcast_log(_log("a", "ch1"))
+    await streamer.broadcast_log(_log("b"))
+    await _drain()
+
+    assert [frame["data"]["message"] for frame in ws_all.sent] == ["a", "b"]
+    assert [frame["data"]["message"] for frame in ws_ch1.sent] == ["a"]
+    assert ws_ch2.sent == []
+
+
+@pytest.mark.asyncio
+async def test_log_and_log_batch_framing(streamer):
+    """연결에 해당하는 로그가 하나면 log, 여러 개면 log_batch 한 프레임으로 전송"""
+    ws_all = await _connect(streamer, "all")
+    ws_ch1 = await _connect(streamer, "ch1-only")
+    await streamer.subscribe_to_chapter("ch1-only", "ch1")
+    await _drain()
+    ws_all.sent.clear()
+    ws_ch1.sent.clear()
+
+    await streamer.broadcast_logs([_log("a", "ch1"), _log("b", "ch2"), _log("c")])
+    await _drain()
+
+    assert len(ws_all.sent) == 1
+    assert ws_all.sent[0]["type"] == "log_batch"
+    assert [log["message"] for log in ws_all.sent[0]["data"]] == ["a", "b", "c"]
+
+    assert ws_ch1.sent == [{"type": "log", "data": ws_all.sent[0]["data"][0]}]
+
+
+@pytest.mark.asyncio
+async def test_unserializable_message_does_not_break_connection(streamer):
+    """직렬화할 수 없는 메시지는 예외 없이 False를 반환하고 연결은 유지"""
+    ws = await _connect(streamer, "c1")
+
+    assert await streamer.send_to_connection("c1", {"type": "status", "data": object()}) is False
+    assert await streamer.send_to_connection("c1", {"type": "pong"}) is True
+    await _drain()
+
+    assert ws.sent == [{"type": "pong"}]
+    assert "c1" in streamer.connections
@@ -0,0 +1,30 @@
+"""
+로그 백업 파일 저장 테스트
+"""
+import sys
+import os
+import json
+import shutil
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BACKEND_DIR = os.path.join(PROJECT_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from app.api.v1.endpoints import logs  # noqa: E402
+
+
+def test_backup_write_recreates_deleted_directory(tmp_path):
+    """실행 중 백업 디렉토리가 삭제되어도 다시 만들고 저장"""
+    backup_dir = tmp_path / "backups"
+    backup_path = str(backup_dir / "session.json")
+
+    logs._write_backup_file(backup_path, {"n": 1})
+    assert str(backup_dir) in logs._ensured_dirs
+
+    shutil.rmtree(backup_dir)
+    logs._write_backup_file(backup_path, {"n": 2})
+
+    with open(backup_path, encoding="utf-8") as f:
+        assert json.load(f) == {"n": 2}
+    assert os.listdir(backup_dir) == ["session.json"]
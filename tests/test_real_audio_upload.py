@@ -18,7 +18,12 @@ from app.models.book import Book
 from app.models.audio_chapter import AudioChapter
 
 # 테스트 오디오 파일 경로
-TEST_AUDIO_DIR = "/Users/kimsungwook/dev/voj/tmp_test_media/sample_audiobooks"
+TEST_AUDIO_DIR = os.environ.get(
+    "VOJ_TEST_AUDIO_DIR",
+    os.path.join(PROJECT_ROOT, "tmp_test_media", "sample_audiobooks")
+)
+
+pytestmark = pytest.mark.usefixtures("dynamodb_tables")
 
 
 @pytest.fixture(autouse=True)
@@ -27,13 +32,6 @@ def _local_setup():
     settings.ENVIRONMENT = "local"
     settings.LOCAL_BYPASS_ENABLED = True
     settings.LOCAL_BYPASS_SCOPE = "admin"
-    
-    # 테이블 생성
-    if not Book.exists():
-        Book.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
-    if not AudioChapter.exists():
-        AudioChapter.create_table(read_capacity_units=5, write_capacity_units=5, wait=True)
-    
     yield
 
 
@@ -53,12 +51,11 @@ class TestRealAudioUpload:
             language="ko"
         )
 
-    @pytest.mark.skipif(
-        not os.path.exists(TEST_AUDIO_DIR) or not os.listdir(TEST_AUDIO_DIR),
-        reason="실제 오디오 파일이 없음"
-    )
     def test_upload_real_mp3_file(self):
         """실제 MP3 파일 업로드 테스트"""
+        if not os.path.isdir(TEST_AUDIO_DIR):
+            pytest.skip("실제 오디오 파일이 없음")
+        
         # 첫 번째 MP3 파일 찾기
         mp3_files = [f for f in os.listdir(TEST_AUDIO_DIR) if f.endswith('.m4a')]
         
@@ -105,12 +102,11 @@ class TestRealAudioUpload:
             print(f"Sample rate: {chapter.audio_metadata.sample_rate}Hz")
             print(f"Channels: {chapter.audio_metadata.channels}")
 
-    @pytest.mark.skipif(
-        not os.path.exists(TEST_AUDIO_DIR) or not os.listdir(TEST_AUDIO_DIR),
-        reason="실제 오디오 파일이 없음"
-    )
     def test_upload_multiple_real_files(self):
         """여러 실제 MP3 파일 업로드 테스트"""
+        if not os.path.isdir(TEST_AUDIO_DIR):
+            pytest.skip("실제 오디오 파일이 없음")
+        
         mp3_files = [f for f in os.listdir(TEST_AUDIO_DIR) if f.endswith('.m4a')][:2]  # 처음 2개만
         
         if len(mp3_files) < 2:
@@ -150,6 +146,9 @@ class TestRealAudioUpload:
 
     def test_mp3_metadata_extraction(self):
         """MP3 메타데이터 추출 테스트"""
+        if not os.path.isdir(TEST_AUDIO_DIR):
+            pytest.skip("실제 오디오 파일이 없음")
+        
         mp3_files = [f for f in os.listdir(TEST_AUDIO_DIR) if f.endswith('.mp3')]
         
         if not mp3_files:
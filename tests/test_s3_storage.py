@@ -0,0 +1,213 @@
+"""
+S3 스토리지 서비스 테스트 (moto 사용)
+"""
+import sys
+import os
+import io
+import asyncio
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BACKEND_DIR = os.path.join(PROJECT_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+import boto3  # noqa: E402
+from botocore.exceptions import ClientError  # noqa: E402
+from moto import mock_aws  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.services.storage import s3 as s3_module  # noqa: E402
+from app.services.storage.s3 import S3StorageService  # noqa: E402
+
+
+@pytest.fixture
+def s3_service():
+    """moto 버킷에 연결된 S3StorageService"""
+    with mock_aws():
+        boto3.client("s3", region_name=settings.AWS_REGION).create_bucket(
+            Bucket=settings.S3_BUCKET_NAME,
+            CreateBucketConfiguration={"LocationConstraint": settings.AWS_REGION}
+        )
+        yield S3StorageService()
+
+
+@pytest.mark.asyncio
+async def test_service_keeps_working_after_aclose(s3_service):
+    """aclose 이후(예: Lambda 호출 간 lifespan 종료)에도 다음 호출에서 스레드 풀 재생성"""
+    result = await s3_service.upload_file(io.BytesIO(b"abc"), "a/1.m4a", "audio/mp4")
+    assert result.success
+
+    await s3_service.aclose()
+
+    info = await s3_service.get_file_info("a/1.m4a")
+    assert info is not None and info.size == 3
+    assert await s3_service.delete_file("a/1.m4a") is True
+
+    # 중복 종료도 안전
+    await s3_service.aclose()
+    await s3_service.aclose()
+
+
+def _count_calls(service, operation):
+    """S3 API 호출 횟수 카운터 (botocore 이벤트 훅)"""
+    calls = []
+    service.s3_client.meta.events.register(
+        f"before-call.s3.{operation}", lambda **kwargs: calls.append(operation)
+    )
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_file_info_shares_one_head_request(s3_service):
+    """동시 get_file_info 호출은 HEAD 요청 하나를 공유"""
+    await s3_service.upload_file(io.BytesIO(b"abc"), "a/1.m4a", "audio/mp4")
+    s3_service._head_cache.clear()
+    head_calls = _count_calls(s3_service, "HeadObject")
+
+    results = await asyncio.gather(*(s3_service.get_file_info("a/1.m4a") for _ in range(5)))
+
+    assert len(head_calls) == 1
+    assert all(info is not None and info.size == 3 for info in results)
+
+    # TTL 이내의 재조회도 캐시 사용
+    assert await s3_service.file_exists("a/1.m4a") is True
+    assert len(head_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_file_info_refetched_after_ttl(s3_service, monkeypatch):
+    """TTL이 지나면 다시 HEAD 요청"""
+    monkeypatch.setattr(s3_module, "_HEAD_CACHE_TTL", 0.0)
+    await s3_service.upload_file(io.BytesIO(b"abc"), "a/1.m4a", "audio/mp4")
+    head_calls = _count_calls(s3_service, "HeadObject")
+
+    await s3_service.get_file_info("a/1.m4a")
+    await s3_service.get_file_info("a/1.m4a")
+
+    assert len(head_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_file_info_is_not_cached(s3_service, monkeypatch):
+    """HEAD 실패 결과는 캐시에서 제거되어 다음 호출에서 다시 조회"""
+    await s3_service.upload_file(io.BytesIO(b"abc"), "a/1.m4a", "audio/mp4")
+    s3_service._head_cache.clear()
+    real_head_object = s3_service.s3_client.head_object
+    attempts = []
+
+    def flaky_head_object(**kwargs):
+        attempts.append(kwargs["Key"])
+        if len(attempts) == 1:
+            raise ClientError({"Error": {"Code": "503", "Message": "Slow Down"}}, "HeadObject")
+        return real_head_object(**kwargs)
+
+    monkeypatch.setattr(s3_service.s3_client, "head_object", flaky_head_object)
+
+    with pytest.raises(ClientError):
+        await s3_service.get_file_info("a/1.m4a")
+    await asyncio.sleep(0)
+    assert "a/1.m4a" not in s3_service._head_cache
+
+    info = await s3_service.get_file_info("a/1.m4a")
+    assert info is not None and info.size == 3
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_upload_and_delete_invalidate_cached_file_info(s3_service):
+    """업로드/삭제 후에는 캐시된 HEAD 결과 대신 새 정보를 반환"""
+    await s3_service.upload_file(io.BytesIO(b"abc"), "a/1.m4a", "audio/mp4")
+    assert (await s3_service.get_file_info("a/1.m4a")).size == 3
+
+    await s3_service.upload_file(io.BytesIO(b"abcde"), "a/1.m4a", "audio/mp4")
+    assert (await s3_service.get_file_info("a/1.m4a")).size == 5
+
+    assert await s3_service.delete_file("a/1.m4a") is True
+    assert await s3_service.get_file_info("a/1.m4a") is None
+
+    await s3_service.upload_file(io.BytesIO(b"abc"), "a/2.m4a", "audio/mp4")
+    assert await s3_service.file_exists("a/2.m4a") is True
+    await s3_service.delete_files(["a/2.m4a"])
+    assert await s3_service.file_exists("a/2.m4a") is False
+
+
+@pytest.mark.asyncio
+async def test_delete_files_deduplicates_keys(s3_service):
+    """중복 키는 한 번만 요청하고 결과도 키별로 하나"""
+    for name in ("1", "2"):
+        await s3_service.upload_file(io.BytesIO(b"x"), f"d/{name}.mp3", "audio/mpeg")
+    delete_calls = _count_calls(s3_service, "DeleteObjects")
+
+    results = await s3_service.delete_files(["d/1.mp3", "d/2.mp3", "d/1.mp3"])
+
+    assert results == {"d/1.mp3": True, "d/2.mp3": True}
+    assert len(delete_calls) == 1
+    assert await s3_service.list_files("d/") == []
+
+
+@pytest.mark.asyncio
+async def test_delete_files_reports_partial_errors(s3_service, monkeypatch):
+    """delete_objects 응답의 Errors에 포함된 키만 실패로 표시"""
+    real_delete_objects = s3_service.s3_client.delete_objects
+
+    def partial_delete_objects(**kwargs):
+        response = real_delete_objects(**kwargs)
+        response["Errors"] = [{"Key": "d/2.mp3", "Code": "AccessDenied", "Message": "Access Denied"}]
+        return response
+
+    monkeypatch.setattr(s3_service.s3_client, "delete_objects", partial_delete_objects)
+
+    results = await s3_service.delete_files(["d/1.mp3", "d/2.mp3"])
+
+    assert results == {"d/1.mp3": True, "d/2.mp3": False}
+
+
+@pytest.mark.asyncio
+async def test_iter_files_follows_pagination(s3_service):
+    """1000개를 넘는 목록은 여러 페이지에 걸쳐 모두 반환"""
+    raw_client = boto3.client("s3", region_name=settings.AWS_REGION)
+    for i in range(1003):
+        raw_client.put_object(Bucket=settings.S3_BUCKET_NAME, Key=f"many/{i:04d}.mp3", Body=b"x")
+    await s3_service.upload_file(io.BytesIO(b"x"), "other/1.mp3", "audio/mpeg")
+    list_calls = _count_calls(s3_service, "ListObjectsV2")
+
+    files = [info async for info in s3_service.iter_files(prefix="many/")]
+
+    assert len(files) == 1003
+    assert len(list_calls) == 2
+    assert files[0].key == "many/0000.mp3" and files[-1].key == "many/1002.mp3"
+    assert {info.content_type for info in files} == {"audio/mpeg"}
+
+
+@pytest.mark.asyncio
+async def test_list_files_limit(s3_service):
+    """list_files는 limit 개수까지만 반환"""
+    for i in range(5):
+        await s3_service.upload_file(io.BytesIO(b"x"), f"p/{i}.mp3", "audio/mpeg")
+
+    assert len(await s3_service.list_files("p/", limit=3)) == 3
+    assert len(await s3_service.list_files("p/", limit=100)) == 5
+
+
+
+@pytest.mark.asyncio
+async def test_iter_range_streams_whole_object_and_byte_ranges(s3_service):
+    """iter_range는 객체 전체 또는 요청한 바이트 범위를 청크 단위로 반환"""
+    await s3_service.upload_file(io.BytesIO(b"abcdefgh"), "a/1.m4a", "audio/mp4")
+
+    chunks = [chunk async for chunk in s3_service.iter_range("a/1.m4a", chunk_size=3)]
+    assert chunks == [b"abc", b"def", b"gh"]
+
+    assert b"".join([c async for c in s3_service.iter_range("a/1.m4a", 2, 5)]) == b"cdef"
+    assert b"".join([c async for c in s3_service.iter_range("a/1.m4a", 6)]) == b"gh"
+
+    # download_file은 크기와 무관하게 전체 bytes 반환 (기존 계약 유지)
+    assert await s3_service.download_file("a/1.m4a") == b"abcdefgh"
+    assert await s3_service.download_file("a/missing.m4a") is None
+
+
+def test_client_connection_pool_covers_s3_concurrency(s3_service):
+    """연결 풀이 전용 스레드 풀과 전송 스레드를 동시에 수용할 만큼 큼"""
+    max_pool = s3_service.s3_client.meta.config.max_pool_connections
+    assert max_pool >= s3_service._get_executor()._max_workers + s3_module._TRANSFER_MAX_CONCURRENCY